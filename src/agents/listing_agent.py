@@ -6,7 +6,7 @@ from typing import Optional
 from openai import OpenAI
 from pydantic import BaseModel, Field
 
-from src.core.config import settings
+from src.core.openai_client import get_openai_client
 from src.models.listing import Listing
 from src.models.user import User
 
@@ -48,12 +48,13 @@ class ListingAgent:
         """Initialize the listing agent
 
         Args:
-            openai_api_key: OpenAI API key (defaults to settings)
+            openai_api_key: OpenAI API key (defaults to the shared settings client)
             model: Model to use for evaluation (default: gpt-4o-mini for cost efficiency)
         """
-        api_key = openai_api_key or settings.openai_api_key
-
-        self.client = OpenAI(api_key=api_key)
+        # Only build a dedicated client when an explicit key overrides settings
+        self.client = (
+            OpenAI(api_key=openai_api_key) if openai_api_key else get_openai_client()
+        )
         self.model = model
 
         self.token_costs = {
@@ -1,14 +1,19 @@
 from dataclasses import dataclass
-from typing import Any, List, Literal, Optional
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Type
 
 from pydantic_ai.messages import (
     ModelMessage,
     ModelRequest,
     ModelResponse,
+    TextPart,
+    ThinkingPart,
     ToolCallPart,
     UserPromptPart,
 )
 
+# Response parts whose content is shown as assistant text
+_TEXT_PARTS = (TextPart, ThinkingPart)
+
 
 @dataclass
 class ChatToolCall:
@@ -38,6 +43,13 @@ class MessageHistoryFormatter:
         """
         self.truncate_content = truncate_content
         self.truncate_args = truncate_args
+        # Dispatch on the exact message class rather than walking isinstance checks
+        self._message_handlers: Dict[
+            Type[Any], Callable[[Any], Optional[ChatMessage]]
+        ] = {
+            ModelRequest: self._format_request,
+            ModelResponse: self._format_response,
+        }
 
     def format_history(self, messages: List[ModelMessage]) -> List[ChatMessage]:
         """
@@ -49,55 +61,67 @@ class MessageHistoryFormatter:
         Returns:
             List of ChatMessage objects
         """
-        chat_messages: List[ChatMessage] = []
+        return list(self.iter_history(messages))
+
+    def iter_history(self, messages: List[ModelMessage]) -> Iterator[ChatMessage]:
+        """
+        Lazily convert ModelMessages to ChatMessages, one at a time.
+
+        Args:
+            messages: Raw pydantic-ai message history
 
+        Yields:
+            ChatMessage objects, skipping malformed messages
+        """
         for message in messages:
-            try:
-                if isinstance(message, ModelRequest) and message.parts:
-                    # Handle user messages
-                    part = message.parts[0]
-                    if isinstance(part, UserPromptPart):
-                        content = self._extract_content(part.content)
-                        content = self._truncate_text(content, self.truncate_content)
-
-                        chat_message = ChatMessage(role="user", content=content)
-                        chat_messages.append(chat_message)
-
-                elif isinstance(message, ModelResponse) and message.parts:
-                    # Handle assistant messages
-                    text_parts: List[str] = []
-                    tool_calls: List[ChatToolCall] = []
-
-                    for part in message.parts:
-                        if hasattr(part, "content") and getattr(part, "content", None):
-                            content = self._extract_content(getattr(part, "content"))
-                            text_parts.append(content)
-
-                        elif isinstance(part, ToolCallPart):
-                            args_str = self._format_tool_args(part.args)
-                            args_str = self._truncate_text(args_str, self.truncate_args)
-
-                            tool_call = ChatToolCall(
-                                tool_name=part.tool_name, args=args_str
-                            )
-                            tool_calls.append(tool_call)
-
-                    # Combine text content
-                    content = " ".join(text_parts) if text_parts else ""
-                    content = self._truncate_text(content, self.truncate_content)
-
-                    chat_message = ChatMessage(
-                        role="assistant",
-                        content=content,
-                        tool_calls=tool_calls if tool_calls else None,
-                    )
-                    chat_messages.append(chat_message)
+            handler = self._message_handlers.get(type(message))
+            if handler is None or not message.parts:
+                continue
 
+            try:
+                chat_message = handler(message)
             except (IndexError, AttributeError, TypeError):
                 # Skip malformed messages
                 continue
 
-        return chat_messages
+            if chat_message is not None:
+                yield chat_message
+
+    def _format_request(self, message: ModelRequest) -> Optional[ChatMessage]:
+        """Format a user prompt request; other requests (tool returns) are skipped."""
+        part = message.parts[0]
+        if type(part) is not UserPromptPart:
+            return None
+
+        content = self._extract_content(part.content)
+        return ChatMessage(
+            role="user", content=self._truncate_text(content, self.truncate_content)
+        )
+
+    def _format_response(self, message: ModelResponse) -> ChatMessage:
+        """Format a model response into text content plus tool calls."""
+        text_parts = [
+            self._extract_content(part.content)
+            for part in message.parts
+            if type(part) in _TEXT_PARTS and part.content
+        ]
+        tool_calls = [
+            ChatToolCall(
+                tool_name=part.tool_name,
+                args=self._truncate_text(
+                    self._format_tool_args(part.args), self.truncate_args
+                ),
+            )
+            for part in message.parts
+            if type(part) is ToolCallPart
+        ]
+
+        content = " ".join(text_parts)
+        return ChatMessage(
+            role="assistant",
+            content=self._truncate_text(content, self.truncate_content),
+            tool_calls=tool_calls or None,
+        )
 
     def _extract_content(self, content: Any) -> str:
         """Extract string content from various content types."""
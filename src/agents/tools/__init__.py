@@ -1,4 +1,4 @@
 from .preferences import update_user_preferences
 from .profile import mark_profile_complete
 
-tools = [update_user_preferences, mark_profile_complete]
+tools = (update_user_preferences, mark_profile_complete)
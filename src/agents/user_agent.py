@@ -1,19 +1,31 @@
+import asyncio
 import logging
 import uuid
-from typing import AsyncGenerator, List, Optional
+from functools import cache
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+)
 
 import logfire
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.messages import (
     ModelMessage,
-    ModelMessagesTypeAdapter,
+    ModelRequest,
     PartDeltaEvent,
     PartStartEvent,
     TextPart,
     TextPartDelta,
     ToolCallPart,
+    UserPromptPart,
 )
-from pydantic_ai.tools import ToolFuncEither
 from sqlalchemy.orm.session import Session
 
 from src.agents.deps import UserAgentDependencies
@@ -25,13 +37,110 @@ from src.agents.stream_events import (
     UserAgentStreamEvent,
 )
 from src.agents.tools import tools
+from src.core.config import settings
 from src.models.user import User
 from src.models.user_session import UserSession
 
 logger = logging.getLogger(__name__)
 
-logfire.configure()
-logfire.instrument_pydantic_ai()
+
+# Stream event conversion, dispatched on the exact pydantic-ai class so each
+# token costs two dict lookups instead of a chain of isinstance checks
+_PART_START_HANDLERS: Dict[Type[Any], Callable[[Any], UserAgentStreamEvent]] = {
+    TextPart: lambda part: TextStartEvent(content=part.content),
+    ToolCallPart: lambda part: ToolCallEvent(tool_name=part.tool_name),
+}
+# ToolCallPartDelta is skipped - we don't expose args
+_PART_DELTA_HANDLERS: Dict[Type[Any], Callable[[Any], UserAgentStreamEvent]] = {
+    TextPartDelta: lambda delta: TextChunkEvent(content=delta.content_delta),
+}
+
+
+def _part_start(event: PartStartEvent) -> Optional[UserAgentStreamEvent]:
+    handler = _PART_START_HANDLERS.get(type(event.part))
+    return handler(event.part) if handler is not None else None
+
+
+def _part_delta(event: PartDeltaEvent) -> Optional[UserAgentStreamEvent]:
+    handler = _PART_DELTA_HANDLERS.get(type(event.delta))
+    return handler(event.delta) if handler is not None else None
+
+
+_STREAM_EVENT_HANDLERS: Dict[
+    Type[Any], Callable[[Any], Optional[UserAgentStreamEvent]]
+] = {
+    PartStartEvent: _part_start,
+    PartDeltaEvent: _part_delta,
+}
+
+
+def _to_stream_event(event: Any) -> Optional[UserAgentStreamEvent]:
+    """Convert a pydantic-ai model stream event, or None if it isn't exposed"""
+    handler = _STREAM_EVENT_HANDLERS.get(type(event))
+    return handler(event) if handler is not None else None
+
+
+@cache
+def _init_observability() -> None:
+    """Configure logfire and pydantic-ai instrumentation once per process"""
+    logfire.configure()
+    logfire.instrument_pydantic_ai()
+
+
+MODEL = "openai:gpt-4o"
+
+# Rough budget for the history sent to the model on each turn
+MAX_HISTORY_TOKENS = 8000
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(message: ModelMessage) -> int:
+    """Estimate token count of a message from the length of its parts"""
+    chars = 0
+    for part in message.parts:
+        if isinstance(part, ToolCallPart):
+            chars += len(part.args_as_json_str())
+        else:
+            chars += len(str(getattr(part, "content", "")))
+    return chars // CHARS_PER_TOKEN
+
+
+def _truncate_history(
+    messages: list[ModelMessage], max_tokens: int = MAX_HISTORY_TOKENS
+) -> list[ModelMessage]:
+    """
+    Apply a sliding window to message history before sending it to the model.
+
+    History is split into turns, each starting at a user prompt. The first turn
+    (system prompt + grounding user message) is always kept, then the oldest
+    turns after it are dropped until the estimate fits. Whole turns are dropped
+    so tool calls are never separated from their results.
+    """
+    turns: list[list[ModelMessage]] = []
+    for message in messages:
+        starts_turn = isinstance(message, ModelRequest) and any(
+            isinstance(part, UserPromptPart) for part in message.parts
+        )
+        if starts_turn or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+
+    turn_tokens = [sum(_estimate_tokens(m) for m in turn) for turn in turns]
+    total_tokens = sum(turn_tokens)
+    if total_tokens <= max_tokens:
+        return messages
+
+    # Always keep the first and the most recent turn
+    first_kept = 1
+    while first_kept < len(turns) - 1 and total_tokens > max_tokens:
+        total_tokens -= turn_tokens[first_kept]
+        first_kept += 1
+
+    truncated = list(turns[0])
+    for turn in turns[first_kept:]:
+        truncated.extend(turn)
+    return truncated
 
 
 class UserAgent:
@@ -39,14 +148,20 @@ class UserAgent:
 
     _db_session: Session
     _user_session_id: str
+    _user_session: UserSession
     _user: User
     _agent_deps: UserAgentDependencies
     _agent: Agent[UserAgentDependencies]
     _message_history: list[ModelMessage]
-    _tools: list[ToolFuncEither[UserAgentDependencies]]
+
+    # Tools and system prompt are static, so every instance shares one agent
+    _shared_agent: ClassVar[Optional[Agent[UserAgentDependencies]]] = None
+    _history_formatter: ClassVar[MessageHistoryFormatter] = MessageHistoryFormatter()
 
     def __init__(self, db_session: Session, user: User):
-        self._model = "openai:gpt-4o"
+        if settings.logfire_enabled:
+            _init_observability()
+
         self._user = user
         self._db_session = db_session
         self._agent_deps = UserAgentDependencies(db=db_session, user=user)
@@ -54,26 +169,31 @@ class UserAgent:
 
         self._load_or_create_session()
 
-        self._tools = tools
-        self._agent = Agent(
-            model=self._model, deps_type=UserAgentDependencies, tools=self._tools
-        )
-        self._set_system_prompt(self._agent)
+        self._agent = self._get_agent()
+
+    @classmethod
+    def _get_agent(cls) -> Agent[UserAgentDependencies]:
+        """Get the shared pydantic-ai agent, building it on first use"""
+        if cls._shared_agent is None:
+            agent = Agent(model=MODEL, deps_type=UserAgentDependencies, tools=tools)
+            cls._set_system_prompt(agent)
+            cls._shared_agent = agent
+        return cls._shared_agent
 
     def _load_or_create_session(self):
         """Load existing session or create new one for user"""
-        user_session = (
-            self._db_session.query(UserSession).filter_by(user_id=self._user.id).first()
-        )
+        # user_id is the primary key, so this is served from the identity map
+        # when the row is already loaded in this session
+        user_session = self._db_session.get(UserSession, self._user.id)
 
         if user_session and user_session.session_id:
+            self._user_session = user_session
             self._user_session_id = user_session.session_id
             self.is_new_session = False
             try:
-                history_data = user_session.get_message_history()
-                self._message_history = ModelMessagesTypeAdapter.validate_python(
-                    history_data
-                )
+                # get_message_history() already returns validated ModelMessage
+                # objects, so don't run them through the type adapter again
+                self._message_history = user_session.get_message_history() or []
                 logger.info(
                     f"Loaded existing session {self._user_session_id} with {len(self._message_history)} messages"
                 )
@@ -84,19 +204,15 @@ class UserAgent:
                 )
                 # If we can't load history, treat as new session
                 # Overwriting existing session.
-                self._create_new_session()
+                self._create_new_session(user_session)
         else:
-            self._create_new_session()
+            self._create_new_session(user_session)
 
-    def _create_new_session(self):
+    def _create_new_session(self, user_session: Optional[UserSession]):
         self._user_session_id = str(uuid.uuid4())
         self._message_history = []
         self.is_new_session = True
 
-        user_session = (
-            self._db_session.query(UserSession).filter_by(user_id=self._user.id).first()
-        )
-
         if user_session:
             user_session.session_id = self._user_session_id
             user_session.set_message_history([])
@@ -108,6 +224,8 @@ class UserAgent:
             user_session.set_message_history([])
             self._db_session.add(user_session)
 
+        self._user_session = user_session
+
         try:
             self._db_session.commit()
             logger.info(
@@ -145,32 +263,23 @@ class UserAgent:
             async with self._agent.iter(
                 prompt_to_use,
                 deps=self._agent_deps,
-                message_history=self._message_history,
+                message_history=_truncate_history(self._message_history),
             ) as agent_run:
                 async for node in agent_run:
                     if Agent.is_model_request_node(node):
                         async with node.stream(agent_run.ctx) as handle_stream:
                             async for event in handle_stream:
-                                if isinstance(event, PartStartEvent):
-                                    if isinstance(event.part, TextPart):
-                                        # Text response starting
-                                        yield TextStartEvent(content=event.part.content)
-                                    elif isinstance(event.part, ToolCallPart):
-                                        # Tool call starting
-                                        yield ToolCallEvent(
-                                            tool_name=event.part.tool_name
-                                        )
-
-                                elif isinstance(event, PartDeltaEvent):
-                                    if isinstance(event.delta, TextPartDelta):
-                                        yield TextChunkEvent(
-                                            content=event.delta.content_delta
-                                        )
-                                    # Skip ToolCallPartDelta - we don't expose args
+                                stream_event = _to_stream_event(event)
+                                if stream_event is not None:
+                                    yield stream_event
 
                 if agent_run.result:
-                    self._message_history = agent_run.result.all_messages()
-                    self._save_message_history()
+                    # Persist the full log, not just the window sent to the model
+                    self._message_history = (
+                        self._message_history + agent_run.result.new_messages()
+                    )
+                    # Sync DB write; run it off the event loop serving other streams
+                    await asyncio.to_thread(self._save_message_history)
 
                 if self.is_new_session:
                     self.is_new_session = False
@@ -181,8 +290,11 @@ class UserAgent:
 
     def get_message_history(self) -> List[ChatMessage]:
         """Get formatted message history as ChatMessage objects."""
-        formatter = MessageHistoryFormatter()
-        return formatter.format_history(self._message_history)
+        return self._history_formatter.format_history(self._message_history)
+
+    def iter_message_history(self) -> Iterator[ChatMessage]:
+        """Lazily yield formatted message history as ChatMessage objects."""
+        return self._history_formatter.iter_history(self._message_history)
 
     @property
     def session_id(self) -> str:
@@ -192,29 +304,23 @@ class UserAgent:
     def _save_message_history(self):
         """Save current message history to database"""
         try:
-            user_session = (
-                self._db_session.query(UserSession)
-                .filter_by(user_id=self._user.id)
-                .first()
+            # The request's db session may have been closed (expunging the row)
+            # before the SSE stream runs, so re-attach the row loaded at
+            # construction instead of querying it again
+            self._db_session.add(self._user_session)
+            self._user_session.set_message_history(self._message_history)
+            self._db_session.commit()
+            logger.debug(
+                f"Saved {len(self._message_history)} messages to session {self._user_session_id}"
             )
 
-            if user_session:
-                user_session.set_message_history(self._message_history)
-                self._db_session.commit()
-                logger.debug(
-                    f"Saved {len(self._message_history)} messages to session {self._user_session_id}"
-                )
-            else:
-                logger.error(
-                    f"No user session found to save history for user {self._user.id}"
-                )
-
         except Exception as e:
             self._db_session.rollback()
             logger.error(f"Failed to save message history: {e}")
             raise
 
-    def _set_system_prompt(self, user_agent: Agent[UserAgentDependencies]):
+    @staticmethod
+    def _set_system_prompt(user_agent: Agent[UserAgentDependencies]):
         def system_prompt(ctx: RunContext[UserAgentDependencies]) -> str:
             return f"""
         You are an experienced real estate agent helping {ctx.deps.user.first_name} find their ideal housing. Your goal is to build a comprehensive, nuanced user profile that captures not just preferences, but also flexibility levels and dealbreakers.
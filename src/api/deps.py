@@ -1,9 +1,16 @@
-from typing import Annotated
+import time
+from typing import Annotated, Any, Dict, Optional
 
-from fastapi import Depends, HTTPException, status
+import jwt
+from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
+from src.agents.user_agent import UserAgent
+from src.api.exceptions import AuthenticationException
+from src.core.cache import TTLCache
+from src.core.config import settings
 from src.core.database import get_db
 from src.core.supabase import get_supabase_client
 from src.models.user import User
@@ -18,26 +25,69 @@ SessionDep = Annotated[Session, Depends(get_db)]
 SupabaseDep = Annotated[AsyncClient, Depends(get_supabase_client)]
 TokenDep = Annotated[HTTPAuthorizationCredentials, Depends(security)]
 
+# Recently validated tokens map to their database user id, so repeat requests
+# skip the Supabase round-trip and the find_or_create write
+_validated_tokens: TTLCache[str, str] = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _seconds_until_expiry(jwt_token: str) -> float:
+    """Read the token's exp claim without verifying the signature"""
+    claims = jwt.decode(jwt_token, options={"verify_signature": False})
+    return float(claims.get("exp", 0)) - time.time()
+
+
+def _verify_token_locally(jwt_token: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify a Supabase JWT against the project's JWT secret.
+
+    Returns:
+        The token claims, or None if the token can't be verified locally
+        (no secret configured or signed with a different key)
+    """
+    if not settings.supabase_jwt_secret:
+        return None
+
+    try:
+        return jwt.decode(
+            jwt_token,
+            settings.supabase_jwt_secret,
+            algorithms=["HS256"],
+            audience="authenticated",
+        )
+    except (jwt.InvalidAlgorithmError, jwt.InvalidSignatureError):
+        return None
+
 
 async def get_current_user(
     token: TokenDep, supabase: SupabaseDep, session: SessionDep
 ) -> User:
     """Validate JWT token and return User model from database"""
     try:
-        # Validate token with Supabase
-        user_response = await supabase.auth.get_user(jwt=token.credentials)
-        if not user_response or not user_response.user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication token",
-            )
+        ttl = _seconds_until_expiry(token.credentials)
+        if ttl <= 0:
+            raise AuthenticationException("Authentication token expired")
+
+        cached_user_id = _validated_tokens.get(token.credentials)
+        if cached_user_id:
+            user = await run_in_threadpool(session.get, User, cached_user_id)
+            if user:
+                return user
 
-        supabase_user = user_response.user
-        supabase_user_id = supabase_user.id
+        claims = _verify_token_locally(token.credentials)
+        if claims:
+            supabase_user_id = claims["sub"]
+            user_metadata = claims.get("user_metadata") or {}
+        else:
+            # Fall back to validating the token with Supabase
+            user_response = await supabase.auth.get_user(jwt=token.credentials)
+            if not user_response or not user_response.user:
+                raise AuthenticationException("Invalid authentication token")
+
+            supabase_user_id = user_response.user.id
+            user_metadata = user_response.user.user_metadata or {}
 
         # Use UserService to find or create user
         user_service = UserService(session)
-        user_metadata = supabase_user.user_metadata or {}
 
         user_data = CreateUserRequest(
             auth_user_id=supabase_user_id,
@@ -49,17 +99,24 @@ async def get_current_user(
             evaluation_credits=5.0,
         )
 
-        user = user_service.find_or_create_user(user_data)
+        # The sync Session blocks, so keep it off the event loop
+        user = await run_in_threadpool(user_service.find_or_create_user, user_data)
+        _validated_tokens.set(token.credentials, user.id, ttl=ttl)
 
         return user
 
-    except HTTPException:
+    except AuthenticationException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Authentication failed: {str(e)}",
-        )
+        raise AuthenticationException(f"Authentication failed: {str(e)}")
 
 
 CurrentUser = Annotated[User, Depends(get_current_user)]
+
+
+def get_user_agent(session: SessionDep, current_user: CurrentUser) -> UserAgent:
+    """Get the current user's agent with their chat session loaded"""
+    return UserAgent(db_session=session, user=current_user)
+
+
+UserAgentDep = Annotated[UserAgent, Depends(get_user_agent)]
@@ -0,0 +1,16 @@
+from fastapi import HTTPException, status
+
+
+class APIException(HTTPException):
+    """Base HTTP error whose status code is fixed per subclass"""
+
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    def __init__(self, detail: str):
+        super().__init__(status_code=self.status_code, detail=detail)
+
+
+class AuthenticationException(APIException):
+    """Raised when a request's bearer token can't be validated"""
+
+    status_code = status.HTTP_401_UNAUTHORIZED
@@ -2,28 +2,45 @@ import logging
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Dict
 
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
 from src.api.deps import CurrentUser
+from src.api.middleware import CORSMiddleware, GZipMiddleware
 from src.api.routes import chat_router, user_router
 from src.core.config import settings
 from src.core.database import get_db_manager
+from src.core.supabase import create_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Constant payloads for the load balancer probes, encoded once at import
+ROOT_RESPONSE = b'{"message":"Dwell API - Real estate recommendations"}'
+HEALTH_OK_RESPONSE = b'{"status":"healthy","database":"connected"}'
+HEALTH_FAILED_RESPONSE = b'{"status":"unhealthy","database":"disconnected"}'
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Handle application lifespan events"""
     # Startup
-    if settings.env in ["local", "development"]:
-        logger.info("Initializing database tables for development...")
-        try:
-            get_db_manager().init_db()
-            logger.info("Database tables initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
-            raise
+    # Migrations are applied once before the server starts (`dwell_cli.py db init`
+    # from the Fly release command / local supervisord), not in every worker
+
+    # Sync dependencies and DB calls run in AnyIO's threadpool, which defaults
+    # to 40 threads and queues requests beyond that
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.api_thread_pool_size
+    )
+
+    # Share one Supabase client (and its HTTP connection pool) across requests
+    # instead of creating one per authenticated request
+    if settings.supabase_url and settings.supabase_anon_key:
+        app.state.supabase = await create_supabase_client()
+
+    # Open a pooled connection up front so the first request doesn't pay for it
+    get_db_manager().check_connection()
 
     yield
 
@@ -36,6 +53,13 @@ app = FastAPI(
     description="Real estate listing recommendation API",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+app.add_middleware(CORSMiddleware, origins=settings.api_cors_origins)
+app.add_middleware(
+    GZipMiddleware,
+    exclude_paths=("/api/v1/chat/message", "/api/v1/chat/history/stream"),
 )
 
 # Include routers
@@ -44,13 +68,13 @@ app.include_router(user_router, prefix="/api/v1")
 
 
 @app.get("/health")
-async def health_check() -> Dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint"""
     db_healthy = get_db_manager().check_connection()
-    return {
-        "status": "healthy" if db_healthy else "unhealthy",
-        "database": "connected" if db_healthy else "disconnected",
-    }
+    return Response(
+        HEALTH_OK_RESPONSE if db_healthy else HEALTH_FAILED_RESPONSE,
+        media_type="application/json",
+    )
 
 
 @app.get("/test-auth")
@@ -68,9 +92,9 @@ async def test_auth(current_user: CurrentUser) -> Dict[str, Any]:
 
 
 @app.get("/")
-async def root() -> Dict[str, str]:
+async def root() -> Response:
     """Root endpoint"""
-    return {"message": "Dwell API - Real estate recommendations"}
+    return Response(ROOT_RESPONSE, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -81,4 +105,9 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
+        log_level=settings.log_level.lower(),
+        # Per-request access lines are only useful while developing
+        access_log=settings.debug,
     )
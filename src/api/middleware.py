@@ -0,0 +1,109 @@
+from typing import Iterable, List, Optional, Tuple
+
+from starlette.middleware.gzip import GZipMiddleware as StarletteGZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = List[Tuple[bytes, bytes]]
+
+ALLOW_METHODS = b"GET, POST, PUT, PATCH, DELETE, OPTIONS"
+PREFLIGHT_MAX_AGE = b"600"
+
+
+class CORSMiddleware:
+    """
+    Pure ASGI CORS middleware.
+
+    Starlette's CORSMiddleware builds Headers/Response objects for every
+    request; this one only scans the raw scope headers for an Origin and
+    appends pre-encoded headers, so requests without one pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp, origins: Iterable[str]):
+        self.app = app
+        self.allow_all = "*" in origins
+        self.allowed_origins = {origin.encode("latin-1") for origin in origins}
+        self.preflight_headers: Headers = [
+            (b"access-control-allow-methods", ALLOW_METHODS),
+            (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+            (b"vary", b"Origin"),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        is_preflight = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = True
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or not self._is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        if is_preflight and scope["method"] == "OPTIONS":
+            headers = self.preflight_headers + [
+                (b"access-control-allow-origin", origin)
+            ]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers: Headers = list(message.get("headers", []))
+                if not any(
+                    name.lower() == b"access-control-allow-origin"
+                    for name, _ in headers
+                ):
+                    headers.append((b"access-control-allow-origin", origin))
+                    headers.append((b"vary", b"Origin"))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self.allow_all or origin in self.allowed_origins
+
+
+class GZipMiddleware:
+    """
+    GZip JSON responses while leaving streaming endpoints untouched.
+
+    Starlette's GZipMiddleware already skips text/event-stream, but gzip
+    buffers output until a compression block fills, which would also hold
+    back NDJSON lines. Requests under exclude_paths bypass it entirely.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude_paths: Iterable[str] = (),
+        minimum_size: int = 512,
+        compresslevel: int = 6,
+    ):
+        self.app = app
+        self.gzip_app = StarletteGZipMiddleware(
+            app, minimum_size=minimum_size, compresslevel=compresslevel
+        )
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        await self.gzip_app(scope, receive, send)
@@ -1,36 +1,32 @@
 import logging
-from typing import List
+from typing import Any, Dict, Iterable, Iterator
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from src.agents.message_formatter import ChatMessage
 from src.agents.user_agent import UserAgent
-from src.api.deps import CurrentUser, get_db
-from src.api.schemas.chat import (
-    ChatHistoryMessage,
-    ChatHistoryResponse,
-    ChatMessageRequest,
+from src.api.deps import CurrentUser, SessionDep, UserAgentDep
+from src.api.schemas.chat import ChatHistoryResponse, ChatMessageRequest
+from src.api.utils.sse import (
+    EventStreamResponse,
+    coalesce_events,
+    create_error_stream,
+    stream_agent_response,
 )
-from src.api.utils.sse import create_error_stream, stream_agent_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-SSE_HEADERS = {
-    "Cache-Control": "no-cache",
-    "Connection": "keep-alive",
-    "Access-Control-Allow-Origin": "*",
-    "Access-Control-Allow-Headers": "*",
-}
-
 
 @router.post("/message")
 async def send_message(
     request: ChatMessageRequest,
     current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    session: SessionDep,
 ):
     """
     Send a message to the agent and stream the response via Server-Sent Events.
@@ -39,86 +35,96 @@ async def send_message(
     Empty messages are allowed - the agent will initiate conversation for new sessions.
     """
     try:
-        # Initialize UserAgent (automatically handles session management)
-        user_agent = UserAgent(db_session=db, user=current_user)
+        # Built here rather than through UserAgentDep so session errors are
+        # still answered with an SSE error frame; the session load blocks,
+        # so it runs in the threadpool
+        user_agent = await run_in_threadpool(
+            UserAgent, db_session=session, user=current_user
+        )
 
-        logger.info(f"Processing message for user {current_user.id}")
+        logger.debug("Processing message for user %s", current_user.id)
 
         # Get agent response stream
         agent_stream = user_agent.chat(user_prompt=request.message)
 
-        # Stream response as SSE
-        response_stream = stream_agent_response(agent_stream)
+        # Stream response as SSE, batching frames that arrive together
+        response_stream = coalesce_events(stream_agent_response(agent_stream))
 
-        return StreamingResponse(
-            response_stream,
-            media_type="text/event-stream",
-            headers=SSE_HEADERS,
-        )
+        return EventStreamResponse(response_stream)
 
     except ValueError as e:
-        logger.info(f"Value Error: {e}")
+        logger.info("Value Error: %s", e)
 
-        return StreamingResponse(
-            create_error_stream(str(e), "validation_error"),
-            media_type="text/event-stream",
-            status_code=400,
-            headers=SSE_HEADERS,
+        return EventStreamResponse(
+            create_error_stream(str(e), "validation_error"), status_code=400
         )
 
     except Exception as e:
-        logger.error(f"Unexpected error processing chat message: {e}", exc_info=True)
+        logger.exception("Unexpected error processing chat message: %s", e)
 
-        return StreamingResponse(
+        return EventStreamResponse(
             create_error_stream(f"Agent processing failed: {str(e)}", "agent_error"),
-            media_type="text/event-stream",
             status_code=500,
-            headers=SSE_HEADERS,
         )
 
 
-@router.get("/history", response_model=ChatHistoryResponse)
-async def get_chat_history(
-    current_user: CurrentUser,
-    db: Session = Depends(get_db),
-) -> ChatHistoryResponse:
+@router.get("/history", responses={200: {"model": ChatHistoryResponse}})
+async def get_chat_history(user_agent: UserAgentDep) -> ORJSONResponse:
     """
     Get the conversation history for the current user's session.
 
     UserAgent handles session management gracefully:
     - Returns empty history if no session exists
     - Creates new session if existing one can't be loaded
+
+    The history is built as plain dicts and encoded directly; the
+    ChatHistoryResponse model only documents the shape, so messages aren't
+    validated a second time on the way out.
     """
-    user_agent = UserAgent(db_session=db, user=current_user)
-    chat_messages = user_agent.get_message_history()
-
-    if not chat_messages:
-        return ChatHistoryResponse(
-            messages=[],
-            session_id=user_agent.session_id,
-            total_messages=0,
-        )
+    messages = [
+        _history_message(message) for message in user_agent.iter_message_history()
+    ]
+
+    return ORJSONResponse(
+        {
+            "messages": messages,
+            "session_id": user_agent.session_id,
+            "total_messages": len(messages),
+        }
+    )
 
-    api_messages: List[ChatHistoryMessage] = []
-    for message in chat_messages:
-        # Convert tool calls to API format
-        tool_calls_dict = None
-        if message.tool_calls:
-            tool_calls_dict = [
-                {"tool_name": tool_call.tool_name, "args": tool_call.args}
-                for tool_call in message.tool_calls
-            ]
-
-        api_message = ChatHistoryMessage(
-            role=message.role,
-            content=message.content,
-            tool_calls=tool_calls_dict,
-            timestamp=None,
-        )
-        api_messages.append(api_message)
 
-    return ChatHistoryResponse(
-        messages=api_messages,
-        session_id=user_agent.session_id,
-        total_messages=len(api_messages),
+@router.get("/history/stream")
+async def stream_chat_history(user_agent: UserAgentDep) -> StreamingResponse:
+    """
+    Stream the conversation history as newline-delimited JSON.
+
+    Messages are encoded one at a time as the client reads them, so long
+    histories are never built up as a list of response models.
+    """
+    return StreamingResponse(
+        _encode_history_ndjson(user_agent.iter_message_history()),
+        media_type="application/x-ndjson",
     )
+
+
+def _history_message(message: ChatMessage) -> Dict[str, Any]:
+    """Convert a chat message to the ChatHistoryMessage shape"""
+    tool_calls = None
+    if message.tool_calls:
+        tool_calls = [
+            {"tool_name": tool_call.tool_name, "args": tool_call.args}
+            for tool_call in message.tool_calls
+        ]
+    return {
+        "role": message.role,
+        "content": message.content,
+        "tool_calls": tool_calls,
+        "timestamp": None,
+    }
+
+
+def _encode_history_ndjson(messages: Iterable[ChatMessage]) -> Iterator[bytes]:
+    """Encode each chat message as one JSON line"""
+    for message in messages:
+        yield orjson.dumps(_history_message(message)) + b"\n"
@@ -1,7 +1,7 @@
 import logging
-from typing import Any, Dict
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from src.api.deps import CurrentUser, get_db
@@ -11,12 +11,17 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/user", tags=["user"])
 
+# Let clients cache the profile but revalidate it on every use, since chat tools
+# can change it (e.g. mark it complete) at any time
+PROFILE_CACHE_CONTROL = "private, no-cache"
+
 
 @router.get("/profile")
-async def get_user_profile(
+def get_user_profile(
+    request: Request,
     current_user: CurrentUser,
     db: Session = Depends(get_db),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get the current user's profile including completion status.
 
@@ -24,24 +29,28 @@ async def get_user_profile(
     - Whether to continue chat or show listings
     - What preferences are set
     - What requirements are missing
+
+    Every field is derived from the user row, so its updated_at doubles as
+    an ETag and unchanged profiles are answered with 304 Not Modified.
     """
+    etag = f'W/"{current_user.id}-{current_user.updated_at.timestamp()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": PROFILE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
     user_service = UserService(db)
     has_requirements, missing = user_service.has_minimum_profile_requirements(
         current_user
     )
 
-    return {
+    profile = {
         "id": current_user.id,
-        "name": current_user.name,
+        "name": f"{current_user.first_name} {current_user.last_name}",
         "occupation": current_user.occupation,
         "bio": current_user.bio,
         # Profile completion status
         "profile_completed": current_user.profile_completed,
-        "profile_completed_at": (
-            current_user.profile_completed_at.isoformat()
-            if current_user.profile_completed_at
-            else None
-        ),
+        "profile_completed_at": current_user.profile_completed_at,
         "has_minimum_requirements": has_requirements,
         "missing_requirements": missing,
         # Preferences
@@ -50,16 +59,8 @@ async def get_user_profile(
         "price_period": (
             current_user.price_period.value if current_user.price_period else None
         ),
-        "preferred_start_date": (
-            current_user.preferred_start_date.isoformat()
-            if current_user.preferred_start_date
-            else None
-        ),
-        "preferred_end_date": (
-            current_user.preferred_end_date.isoformat()
-            if current_user.preferred_end_date
-            else None
-        ),
+        "preferred_start_date": current_user.preferred_start_date,
+        "preferred_end_date": current_user.preferred_end_date,
         "date_flexibility_days": current_user.date_flexibility_days,
         "preferred_listing_type": (
             current_user.preferred_listing_type.value
@@ -68,13 +69,10 @@ async def get_user_profile(
         ),
         "preference_profile": current_user.preference_profile,
         "preference_version": current_user.preference_version,
-        "last_preference_update": (
-            current_user.last_preference_update.isoformat()
-            if current_user.last_preference_update
-            else None
-        ),
+        "last_preference_update": current_user.last_preference_update,
         # Other metadata
         "evaluation_credits": current_user.evaluation_credits,
-        "created_at": current_user.created_at.isoformat(),
-        "updated_at": current_user.updated_at.isoformat(),
+        "created_at": current_user.created_at,
+        "updated_at": current_user.updated_at,
     }
+    return ORJSONResponse(profile, headers=cache_headers)
@@ -1,15 +1,73 @@
-import json
+import asyncio
 import logging
-from typing import Any, AsyncGenerator, Dict
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import orjson
+from fastapi.responses import StreamingResponse
 
 from src.agents.stream_events import UserAgentStreamEvent
 
 logger = logging.getLogger(__name__)
 
+# Encoded once; Starlette would otherwise rebuild these from a dict per response
+SSE_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"cache-control", b"no-cache"),
+    (b"connection", b"keep-alive"),
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-headers", b"*"),
+    # Stop nginx-style proxies from buffering the stream
+    (b"x-accel-buffering", b"no"),
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+]
+
+# A frame is built in one allocation by filling this template with the JSON
+SSE_FRAME = b"data: %b\n\n"
+
+# Constant frames are encoded once at import time
+DONE_EVENT = b'data: {"type":"done"}\n\n'
+
+# Flush coalesced frames once this many bytes are buffered...
+COALESCE_MAX_SIZE = 4096
+# ...or this many seconds after the first buffered frame arrived
+COALESCE_MAX_DELAY = 0.01
+# Frames the producer may run ahead of a slow client before it pauses
+STREAM_QUEUE_SIZE = 64
+
+
+class _StreamEnd:
+    """Queue marker for the end of the source stream."""
+
+    def __init__(self, error: Optional[Exception] = None):
+        self.error = error
+
+
+class EventStreamResponse(StreamingResponse):
+    """StreamingResponse for Server-Sent Events with pre-encoded headers."""
+
+    media_type = "text/event-stream"
+
+    def init_headers(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        self.raw_headers = list(SSE_HEADERS)
+        if headers:
+            self.raw_headers.extend(
+                (k.lower().encode("latin-1"), v.encode("latin-1"))
+                for k, v in headers.items()
+            )
+
 
 async def stream_agent_response(
     agent_stream: AsyncGenerator[UserAgentStreamEvent, None],
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Convert UserAgent stream events to Server-Sent Events format.
 
@@ -17,32 +75,126 @@ async def stream_agent_response(
         agent_stream: AsyncGenerator from UserAgent.chat()
 
     Yields:
-        str: SSE formatted messages
+        bytes: SSE formatted messages
     """
     async for event in agent_stream:
-        yield format_sse_event(event.model_dump())
+        yield _event_to_sse(event)
 
     # Send completion event when stream ends
-    yield format_sse_event({"type": "done"})
+    yield DONE_EVENT
 
 
-def format_sse_event(data: Dict[str, Any]) -> str:
+def _event_to_sse(event: UserAgentStreamEvent) -> bytes:
+    """Encode a stream event as an SSE frame via pydantic's Rust serializer"""
+    # to_json() returns bytes directly, skipping model_dump()'s dict and the
+    # str round-trip of model_dump_json()
+    return SSE_FRAME % event.__pydantic_serializer__.to_json(event)
+
+
+async def coalesce_events(
+    events: AsyncIterator[bytes],
+    max_size: int = COALESCE_MAX_SIZE,
+    max_delay: float = COALESCE_MAX_DELAY,
+    max_queued: int = STREAM_QUEUE_SIZE,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Batch SSE frames so bursts of tokens go out in one body chunk.
+
+    The source is drained by a single producer task, so the agent stream is
+    always iterated from the same task, while frames are yielded here once
+    max_size bytes are buffered or max_delay seconds have passed since
+    the first buffered frame. Errors from the source are re-raised after the
+    buffered frames are flushed.
+
+    The queue between the two is bounded, so a slow client pauses the agent
+    (and its LLM token fetch) instead of frames piling up in memory. If the
+    client disconnects, the producer is cancelled, which stops the agent run.
+
+    Args:
+        events: SSE formatted frames, e.g. from stream_agent_response()
+        max_size: Buffered bytes that trigger an immediate flush
+        max_delay: Longest time a frame is held back, in seconds
+        max_queued: Frames the producer may queue before it waits for the client
+
+    Yields:
+        bytes: One or more concatenated SSE frames
+    """
+    queue: asyncio.Queue[Union[bytes, _StreamEnd]] = asyncio.Queue(maxsize=max_queued)
+
+    async def produce() -> None:
+        try:
+            async for frame in events:
+                await queue.put(frame)
+        except Exception as e:
+            await queue.put(_StreamEnd(error=e))
+        else:
+            await queue.put(_StreamEnd())
+
+    producer = asyncio.create_task(produce())
+    loop = asyncio.get_running_loop()
+    buffer: List[bytes] = []
+    buffered_size = 0
+    deadline = 0.0
+
+    try:
+        while True:
+            try:
+                if not queue.empty():
+                    # Frames that are already waiting are batched without
+                    # arming a timer; the delay only applies when idle
+                    item = queue.get_nowait()
+                elif buffer:
+                    timeout = max(deadline - loop.time(), 0)
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                else:
+                    item = await queue.get()
+            except asyncio.TimeoutError:
+                yield b"".join(buffer)
+                buffer.clear()
+                buffered_size = 0
+                continue
+
+            if isinstance(item, _StreamEnd):
+                if buffer:
+                    yield b"".join(buffer)
+                if item.error is not None:
+                    raise item.error
+                break
+
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(item)
+            buffered_size += len(item)
+
+            if buffered_size >= max_size:
+                yield b"".join(buffer)
+                buffer.clear()
+                buffered_size = 0
+    finally:
+        producer.cancel()
+
+
+def format_sse_event(data: Dict[str, Any]) -> bytes:
     """
     Format data as Server-Sent Event.
 
+    orjson encodes datetimes and UUIDs natively, so data is expected to hold
+    only JSON-native values, datetimes and UUIDs; there is no str() fallback.
+    The frame is kept as bytes since the response body is bytes.
+
     Args:
         data: Dictionary to send as JSON
 
     Returns:
-        str: SSE formatted string
+        bytes: SSE formatted frame
     """
-    json_data = json.dumps(data, default=str)
-    return f"data: {json_data}\n\n"
+    json_data = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return SSE_FRAME % json_data
 
 
 async def create_error_stream(
     error_message: str, error_type: str = "error"
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Create an async generator that yields a single SSE error event.
 
@@ -51,7 +203,7 @@ async def create_error_stream(
         error_type: Type of error (default: "error")
 
     Yields:
-        str: SSE formatted error event
+        bytes: SSE formatted error event
     """
     error_event = {"type": error_type, "error": error_message}
     yield format_sse_event(error_event)
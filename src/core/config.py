@@ -1,9 +1,10 @@
 import os
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -25,6 +26,9 @@ class Settings(BaseSettings):
     supabase_service_key: Optional[str] = Field(
         default=None, description="Supabase service role key (for server-side)"
     )
+    supabase_jwt_secret: Optional[str] = Field(
+        default=None, description="Supabase JWT secret for local token verification"
+    )
 
     # API settings
     api_cors_origins: list[str] = Field(
@@ -37,6 +41,10 @@ class Settings(BaseSettings):
     )
     api_port: int = Field(default=8000, description="API server port")
     api_host: str = Field(default="0.0.0.0", description="API server host")
+    api_thread_pool_size: int = Field(
+        default=100,
+        description="Worker threads for sync dependencies and DB calls in the API",
+    )
 
     # Listings Project credentials
     listings_email: Optional[str] = Field(
@@ -54,6 +62,9 @@ class Settings(BaseSettings):
     env: str = Field(
         default="development", description="Environment (development, test, production)"
     )
+    logfire_enabled: bool = Field(
+        default=True, description="Enable logfire tracing of pydantic-ai agents"
+    )
 
     # Redis/Celery settings
     redis_url: str = Field(
@@ -74,21 +85,6 @@ class Settings(BaseSettings):
         default=6, description="How often to run evaluation tasks (in hours)"
     )
 
-    @staticmethod
-    def get_env_file() -> str:
-        env = os.getenv("ENV", "development")
-        if env == "test":
-            return ".env.test"
-        elif env == "local":
-            return ".env.local"
-        else:
-            return ".env"
-
-    model_config = SettingsConfigDict(
-        env_file=get_env_file(),
-        env_file_encoding="utf-8",
-    )
-
     @property
     def effective_celery_broker_url(self) -> str:
         """Get effective Celery broker URL (falls back to redis_url)"""
@@ -100,19 +96,27 @@ class Settings(BaseSettings):
         return self.celery_result_backend or self.redis_url
 
 
-# Load environment variables from .env files
-def _load_env_files():
-    """Load environment variables from .env files based on ENV variable"""
+def get_env_file() -> str:
+    """Pick the .env file for the ENV environment variable"""
     env = os.getenv("ENV", "development")
     if env == "test":
-        load_dotenv(".env.test", override=True)
+        return ".env.test"
     elif env == "local":
-        load_dotenv(".env.local", override=True)
+        return ".env.local"
     else:
-        load_dotenv(".env", override=True)
+        return ".env"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load the env file and build the settings once per process.
 
+    load_dotenv exports the file to os.environ, where Settings reads it, so
+    the file is parsed once rather than again by pydantic-settings.
+    """
+    load_dotenv(get_env_file(), override=True)
+    return Settings()
 
-# Load env files before creating settings instance
-_load_env_files()
 
-settings = Settings()
+settings = get_settings()
@@ -24,12 +24,19 @@ class Base(DeclarativeBase):
 class DatabaseManager:
     def __init__(self, database_url: Optional[str] = None):
         self.database_url = database_url or settings.database_url
-        self.engine = create_engine(self.database_url, echo=False)
+        # pre_ping replaces pooled connections the server closed while idle;
+        # recycle retires them before proxies/poolers time them out
+        self.engine = create_engine(
+            self.database_url, echo=False, pool_pre_ping=True, pool_recycle=1800
+        )
         self.session_factory = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
         self.project_root = Path(__file__).parent.parent.parent
         self.alembic_cfg_path = self.project_root / "alembic.ini"
+        # Migration scripts are parsed on first use, see script_dir
+        self._script_dir: Optional[ScriptDirectory] = None
+        self._head_revision: Optional[str] = None
 
         if self.alembic_cfg_path.exists():
             self.alembic_cfg = Config(str(self.alembic_cfg_path))
@@ -44,6 +51,25 @@ class DatabaseManager:
                 "Alembic configuration not found, migration features unavailable"
             )
 
+    @property
+    def script_dir(self) -> ScriptDirectory:
+        """Migration script directory, loaded once and reused."""
+        if self._script_dir is None:
+            self._script_dir = ScriptDirectory.from_config(self.alembic_cfg)
+        return self._script_dir
+
+    @property
+    def head_revision(self) -> Optional[str]:
+        """Head revision of the migration scripts, computed once."""
+        if self._head_revision is None:
+            self._head_revision = self.script_dir.get_current_head()
+        return self._head_revision
+
+    def _reload_scripts(self) -> None:
+        """Drop the cached scripts so newly written migrations are picked up."""
+        self._script_dir = None
+        self._head_revision = None
+
     def init_db(self) -> None:
         """Initialize database using Alembic migrations."""
         if self.has_alembic:
@@ -63,12 +89,10 @@ class DatabaseManager:
         logger.warning("Resetting database - all data will be lost!")
 
         if self.has_alembic:
-            # Drop all tables including enum types
-            with self.engine.connect() as conn:
-                # Drop all tables
+            # Drop all tables including enum types, in one transaction
+            with self.engine.begin() as conn:
                 conn.execute(text("DROP SCHEMA public CASCADE"))
                 conn.execute(text("CREATE SCHEMA public"))
-                conn.commit()
 
             # Run migrations to recreate tables
             self.upgrade("head")
@@ -82,7 +106,8 @@ class DatabaseManager:
         """Check database connection."""
         try:
             with self.engine.connect() as connection:
-                connection.execute(text("SELECT 1"))
+                # Raw driver SQL skips text() construction and compilation
+                connection.exec_driver_sql("SELECT 1")
             logger.info("Database connection successful")
             return True
         except Exception as e:
@@ -111,17 +136,11 @@ class DatabaseManager:
         if not self.has_alembic:
             return []
 
-        script = ScriptDirectory.from_config(self.alembic_cfg)
         current = self.get_current_revision()
 
-        pending: List[str] = []
-        for revision in script.walk_revisions():
-            if current is None or revision.revision != current:
-                pending.append(revision.revision)
-                if revision.revision == current:
-                    break
-
-        return list(reversed(pending[:-1] if current else pending))
+        # Walks head -> current, excluding current; "base" when none applied
+        revisions = self.script_dir.iterate_revisions("heads", current or "base")
+        return [revision.revision for revision in reversed(list(revisions))]
 
     def create_migration(self, message: str, autogenerate: bool = True) -> str:
         """Create a new migration.
@@ -143,8 +162,8 @@ class DatabaseManager:
         else:
             command.revision(self.alembic_cfg, message=message)
 
-        script = ScriptDirectory.from_config(self.alembic_cfg)
-        head = script.get_current_head()
+        self._reload_scripts()
+        head = self.head_revision
         logger.info(f"Created migration {head}: {message}")
         return head or ""
 
@@ -186,11 +205,10 @@ class DatabaseManager:
         if not self.has_alembic:
             return []
 
-        script = ScriptDirectory.from_config(self.alembic_cfg)
         current = self.get_current_revision()
 
         history: List[Dict[str, Any]] = []
-        for revision in script.walk_revisions():
+        for revision in self.script_dir.walk_revisions():
             entry: Dict[str, Any] = {
                 "revision": revision.revision,
                 "message": revision.doc,
@@ -224,9 +242,7 @@ class DatabaseManager:
 
         current = self.get_current_revision()
         pending = self.get_pending_migrations()
-
-        script = ScriptDirectory.from_config(self.alembic_cfg)
-        head = script.get_current_head()
+        head = self.head_revision
 
         return {
             "current_revision": current,
@@ -0,0 +1,18 @@
+from functools import cache
+
+import httpx
+from openai import OpenAI
+
+from src.core.config import settings
+
+
+@cache
+def get_openai_client() -> OpenAI:
+    """Get the process-wide OpenAI client so connections are reused across agents"""
+    return OpenAI(
+        api_key=settings.openai_api_key,
+        http_client=httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=True,
+        ),
+    )
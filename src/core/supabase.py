@@ -1,9 +1,13 @@
+from typing import Optional
+
+from fastapi import Request
+
 from src.core.config import settings
 from supabase import AsyncClientOptions
 from supabase._async.client import AsyncClient, create_client
 
 
-async def get_supabase_client() -> AsyncClient:
+async def create_supabase_client() -> AsyncClient:
     if not settings.supabase_url or not settings.supabase_anon_key:
         raise ValueError("Supabase URL and anon key must be configured")
 
@@ -14,3 +18,12 @@ async def get_supabase_client() -> AsyncClient:
             postgrest_client_timeout=10, storage_client_timeout=10
         ),
     )
+
+
+async def get_supabase_client(request: Request) -> AsyncClient:
+    """Get the app's shared Supabase client, creating it on first use"""
+    client: Optional[AsyncClient] = getattr(request.app.state, "supabase", None)
+    if client is None:
+        client = await create_supabase_client()
+        request.app.state.supabase = client
+    return client
@@ -1,4 +1,4 @@
 from src.ingestors.base_ingestor import BaseIngestor, SyncResult
-from src.ingestors.ingestor import Ingestor, ingestor
+from src.ingestors.ingestor import Ingestor, get_ingestor
 
-__all__ = ["BaseIngestor", "SyncResult", "Ingestor", "ingestor"]
+__all__ = ["BaseIngestor", "SyncResult", "Ingestor", "get_ingestor"]
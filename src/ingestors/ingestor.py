@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import yaml
 
@@ -10,32 +11,57 @@ from src.ingestors.listing_project import ListingProjectIngestor
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+# Parsed config files keyed by (absolute path, mtime, size), so re-creating an
+# Ingestor doesn't re-parse an unchanged file. Entries are shared - read only.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Any] = {}
+
 
 class Ingestor:
     def __init__(self, config_file: str = "ingestors.yaml"):
         self._ingestors: Dict[str, Type[BaseIngestor]] = {}
         self._config_file = config_file
         self._ingestor_configs: Dict[str, Dict[str, Any]] = {}
+        # Per-source configs with credentials already resolved
+        self._resolved_configs: Dict[str, Dict[str, Any]] = {}
+        self._config_path = self._resolve_config_path()
         self._load_ingestor_configs()
         self._register_ingestors()
 
-    def _load_ingestor_configs(self):
-        try:
+    def _resolve_config_path(self) -> Optional[str]:
+        """Find the config file, returning its absolute path or None"""
+        candidates = [
             # Look for config file in project root
-            config_path = self._config_file
-            if not os.path.exists(config_path):
-                # Try relative to this module
-                config_path = os.path.join(
-                    os.path.dirname(__file__), "..", "..", self._config_file
-                )
+            self._config_file,
+            # Try relative to this module
+            os.path.join(os.path.dirname(__file__), "..", "..", self._config_file),
+        ]
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return os.path.abspath(candidate)
+        return None
 
-            if not os.path.exists(config_path):
+    def _load_ingestor_configs(self):
+        try:
+            config_path = self._config_path
+            if config_path is None:
                 logger.warning(f"Ingestor config file not found: {self._config_file}")
                 self._ingestor_configs = {}
                 return
 
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+            stat = os.stat(config_path)
+            cache_key = (config_path, stat.st_mtime_ns, stat.st_size)
+            if cache_key in _CONFIG_CACHE:
+                config_data = _CONFIG_CACHE[cache_key]
+            else:
+                with open(config_path, "r", encoding="utf-8") as f:
+                    config_data = yaml.load(f, Loader=YamlLoader)
+                _CONFIG_CACHE[cache_key] = config_data
 
             if not config_data or "ingestors" not in config_data:
                 logger.warning(
@@ -85,20 +111,26 @@ class Ingestor:
         Raises:
             ValueError: If source_name is not configured
         """
-        if source_name not in self._ingestor_configs:
-            available = list(self._ingestor_configs.keys())
-            raise ValueError(
-                f"No configuration found for '{source_name}'. Available: {available}"
-            )
+        resolved = self._resolved_configs.get(source_name)
+        if resolved is None:
+            if source_name not in self._ingestor_configs:
+                available = list(self._ingestor_configs.keys())
+                raise ValueError(
+                    f"No configuration found for '{source_name}'. Available: {available}"
+                )
 
-        source_config = self._ingestor_configs[source_name].copy()
+            resolved = self._ingestor_configs[source_name].copy()
+
+            # Resolve credentials from environment variables
+            if "credentials" in resolved:
+                resolved["credentials"] = self._resolve_credentials(
+                    resolved["credentials"]
+                )
 
-        # Resolve credentials from environment variables
-        if "credentials" in source_config:
-            resolved_creds = self._resolve_credentials(source_config["credentials"])
-            source_config["credentials"] = resolved_creds
+            self._resolved_configs[source_name] = resolved
 
-        return source_config
+        # Copy so callers can't modify the cached config
+        return resolved.copy()
 
     def _merge_ingestor_config(
         self, base_config: Dict[str, Any], sync_params: Dict[str, Any]
@@ -260,11 +292,19 @@ class Ingestor:
         """
         results: Dict[str, SyncResult] = {}
         enabled_sources = self.get_enabled_sources()
+        if not enabled_sources:
+            return results
 
-        for source_name in enabled_sources:
+        # Sources are independent and network-bound, so sync them side by side
+        with ThreadPoolExecutor(max_workers=len(enabled_sources)) as executor:
+            futures = {
+                source_name: executor.submit(self.sync_source, source_name, sync_params)
+                for source_name in enabled_sources
+            }
+
+        for source_name, future in futures.items():
             try:
-                result = self.sync_source(source_name, sync_params)
-                results[source_name] = result
+                results[source_name] = future.result()
             except Exception as e:
                 logger.error(f"Failed to sync {source_name}: {e}")
                 results[source_name] = SyncResult(
@@ -280,4 +320,14 @@ class Ingestor:
         return results
 
 
-ingestor = Ingestor()
+# Global ingestor instance, created on first use so importing this module
+# doesn't read ingestors.yaml - can be replaced by tests
+_ingestor: Optional[Ingestor] = None
+
+
+def get_ingestor() -> Ingestor:
+    """Get the shared Ingestor, loading its configuration on first call"""
+    global _ingestor
+    if _ingestor is None:
+        _ingestor = Ingestor()
+    return _ingestor
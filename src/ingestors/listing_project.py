@@ -1,16 +1,122 @@
+import logging
 import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from html import unescape
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml import html as lxml_html
 from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
+from urllib3.util.retry import Retry
 
 from src.core.database import get_db_manager
 from src.ingestors.base_ingestor import BaseIngestor, SyncResult
 from src.models.listing import Listing, ListingType, PricePeriod
 
+logger = logging.getLogger(__name__)
+
+# Pages are queried with lxml XPath over its C tree, compiled once at import
+_TEXT_XPATH = etree.XPath(".//text()")
+
+# Listing card containers are matched on their exact class attribute
+_CARD_CLASS = "flex flex-col md:flex-row mb-6"
+_CARD_XPATH = etree.XPath(f"//div[@class='{_CARD_CLASS}']")
+_CARD_LINKS_XPATH = etree.XPath(".//a[@href]")
+_CARD_TITLE_XPATH = etree.XPath("(.//h4)[1]")
+_CARD_NEIGHBORHOOD_XPATH = etree.XPath(
+    "(.//div[contains(concat(' ', normalize-space(@class), ' '), ' text-grey-dark ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' font-semibold ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' text-smish ')])[1]"
+)
+
+# Listing card patterns, compiled once at import
+_LISTING_HREF_RE = re.compile(r"^/listings/[^/]+$")
+_PRICE_RE = re.compile(
+    r"\$\s?([\d,]+)(?:\s?/\s?(month|mo|week|wk|day|night))?", re.IGNORECASE
+)
+# Price suffixes matched by _PRICE_RE; no suffix means monthly
+_PRICE_PERIODS = {
+    "day": PricePeriod.DAY,
+    "night": PricePeriod.DAY,
+    "week": PricePeriod.WEEK,
+    "wk": PricePeriod.WEEK,
+}
+# Date range, e.g. "July 1, 2025 - August 26, 2025"
+_DATE_RANGE_RE = re.compile(
+    r"([A-Za-z]+ \d{1,2},? \d{4})\s*[-–]\s*([A-Za-z]+ \d{1,2},? \d{4})"
+)
+_YEAR_RE = re.compile(r"\b20\d{2}\b")
+
+# Login form CSRF token input and its value attribute, in either order
+_AUTH_TOKEN_INPUT_RE = re.compile(
+    r"<input\b[^>]*\bname=[\"']authenticity_token[\"'][^>]*>", re.IGNORECASE
+)
+_VALUE_ATTR_RE = re.compile(r"\bvalue=[\"']([^\"']*)[\"']", re.IGNORECASE)
+
+# Listing detail page fields, matched on a class token or the label text
+_DETAIL_DESCRIPTION_XPATH = etree.XPath(
+    "(//div[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' text-grey-darkest ')])[1]"
+)
+_DETAIL_NAME_XPATH = etree.XPath(
+    "(//strong[. = 'Name:'])[1]/following-sibling::span[1]"
+)
+_DETAIL_EMAIL_XPATH = etree.XPath(
+    "(//a[contains(concat(' ', normalize-space(@class), ' '), ' contact__a ')])[1]"
+)
+
+# English month names and abbreviations for card dates, e.g. "July"/"Jul" -> 7
+# (spelled out rather than taken from calendar, which follows the locale)
+_MONTH_NAMES = [
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+]
+_MONTHS = {
+    **{name: i for i, name in enumerate(_MONTH_NAMES, start=1)},
+    **{name[:3]: i for i, name in enumerate(_MONTH_NAMES, start=1)},
+    "sept": 9,
+}
+
+
+def _parse_card_date(text: str) -> datetime:
+    """Parse a card date matched by _DATE_RANGE_RE, e.g. "July 1, 2025"
+
+    The regex fixes the shape to "<month> <day>[,] <year>", so the month is
+    looked up in a table instead of going through a general date parser.
+
+    Raises:
+        KeyError: If the month name is not recognised
+        ValueError: If the day is out of range for the month
+    """
+    month, day, year = text.replace(",", " ").split()
+    return datetime(int(year), _MONTHS[month.lower()], int(day))
+
+
+def _stripped_strings(element: Any) -> List[str]:
+    """An lxml element's non-blank text nodes, stripped, in document order"""
+    return [text.strip() for text in _TEXT_XPATH(element) if text.strip()]
+
+
+def _element_text(element: Any, separator: str = "") -> str:
+    """Join an lxml element's stripped text nodes with separator"""
+    return separator.join(_stripped_strings(element))
+
 
 class ListingProjectIngestorConfig(BaseModel):
     email: Optional[str] = Field(default=None, description="Email for authentication")
@@ -32,7 +138,13 @@ class ListingProjectIngestorConfig(BaseModel):
         default=0,
         ge=0,
         le=10,
-        description="Seconds to wait between processing listings",
+        description="Minimum seconds between listing detail page requests",
+    )
+    detail_workers: int = Field(
+        default=8,
+        ge=1,
+        le=16,
+        description="Listing detail pages fetched concurrently",
     )
     skip_errors: bool = Field(
         default=True, description="Continue if individual listing extraction fails"
@@ -56,12 +168,33 @@ class ListingProjectIngestor(BaseIngestor):
 
         self.config = config
 
+        # Keep a pooled keep-alive connection per detail worker (cities are
+        # synced concurrently, each with its own workers), and retry
+        # transient gateway errors instead of dropping the listing
+        adapter = HTTPAdapter(
+            pool_maxsize=self.config.detail_workers
+            * max(len(self.config.supported_cities), 1),
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Spaces out concurrent detail page requests, see _fetch_details
+        self._fetch_lock = threading.Lock()
+        self._next_fetch_at = 0.0
+
+        # Listing IDs taken by a city in this sync, so cities scraped in
+        # parallel don't both insert a listing neither saw in the database
+        self._claim_lock = threading.Lock()
+        self._claimed_ids: Set[str] = set()
+
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
                 "Connection": "keep-alive",
                 "Upgrade-Insecure-Requests": "1",
             }
@@ -133,18 +266,24 @@ class ListingProjectIngestor(BaseIngestor):
             pages_to_fetch = [params.page]
         else:
             # Otherwise fetch from page 1 to max_pages
-            pages_to_fetch = range(1, params.max_pages + 1)
+            pages_to_fetch = list(range(1, params.max_pages + 1))
 
-        for page_num in pages_to_fetch:
-            # Build URL - map enum values to website URL format
-            listing_type_url = (
-                "sublets" if params.listing_type == ListingType.SUBLET else "rentals"
-            )
-            url = f"{self.BASE_URL}/real-estate/{city}/{listing_type_url}"
-            if page_num > 1:
-                url += f"?page={page_num}"
-
-            print(f"Fetching page {page_num}: {url}")
+        # Build URLs up front - map enum values to website URL format
+        listing_type_url = (
+            "sublets" if params.listing_type == ListingType.SUBLET else "rentals"
+        )
+        base_url = f"{self.BASE_URL}/real-estate/{city}/{listing_type_url}"
+        page_urls = [
+            (page_num, base_url if page_num <= 1 else f"{base_url}?page={page_num}")
+            for page_num in pages_to_fetch
+        ]
+        last_page = max(pages_to_fetch)
+        # Read once rather than per listing
+        skip_errors = self.config.skip_errors
+        source_name = self.get_source_name()
+
+        for page_num, url in page_urls:
+            logger.info(f"Fetching page {page_num}: {url}")
 
             # Fetch the page
             try:
@@ -152,146 +291,217 @@ class ListingProjectIngestor(BaseIngestor):
                 response.raise_for_status()
                 html = response.text
             except Exception as e:
-                print(f"Error fetching {url}: {e}")
+                logger.error(f"Error fetching {url}: {e}")
                 stats["errors"] += 1
                 continue
 
-            # Parse HTML
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Find all listing card containers
-            listing_containers: List[Tag] = [
-                tag
-                for tag in soup.find_all("div", class_="flex flex-col md:flex-row mb-6")
-                if isinstance(tag, Tag)
-            ]
+            # Parse HTML and find all listing card containers
+            try:
+                page = lxml_html.fromstring(html)
+            except etree.ParserError:
+                # Empty body
+                page = None
+            listing_containers: List[lxml_html.HtmlElement] = (
+                _CARD_XPATH(page) if page is not None else []
+            )
 
             # If no listings found, we've probably reached the end
             if not listing_containers:
-                print(f"No listings found on page {page_num}, stopping pagination")
+                logger.info(
+                    f"No listings found on page {page_num}, stopping pagination"
+                )
                 break
 
             stats["pages_processed"] += 1
-            page_new_count = 0
 
-            # Process listing containers
+            # Collect the page's listing links before touching the database
+            page_listings: List[Tuple[lxml_html.HtmlElement, str, str]] = []
             for container in listing_containers:
                 # Find the listing link within this container
-                link = container.find("a", href=re.compile(r"^/listings/[^/]+$"))
-                if not link or not isinstance(link, Tag):
-                    continue
-
-                href = link.get("href", "")
-                listing_id = str(href).split("/")[-1] if href else None
+                href = next(
+                    (
+                        link.get("href")
+                        for link in _CARD_LINKS_XPATH(container)
+                        if _LISTING_HREF_RE.search(link.get("href"))
+                    ),
+                    None,
+                )
+                listing_id = href.split("/")[-1] if href else None
 
                 if not listing_id:
                     continue
 
+                page_listings.append((container, f"{self.BASE_URL}{href}", listing_id))
+
+            # Check the whole page for existing listings in one query
+            existing_ids = self._existing_listing_ids(
+                [listing_id for _, _, listing_id in page_listings]
+            )
+
+            # Extract card data; detail pages are then fetched concurrently
+            cards: List[Tuple[str, str, Dict[str, Any]]] = []
+            for container, listing_url, listing_id in page_listings:
                 stats["total_processed"] += 1
 
-                # Check if listing already exists in database (deduplication)
-                with get_db_manager().get_session() as db:
-                    db: Session
-                    existing_listing = (
-                        db.query(Listing).filter(Listing.id == listing_id).first()
-                    )
-                    if existing_listing:
-                        print(f"Skipping duplicate listing: {listing_id}")
-                        stats["duplicates_skipped"] += 1
-                        continue
+                # Skip listings already in the database (deduplication)
+                if listing_id in existing_ids:
+                    logger.debug("Skipping duplicate listing: %s", listing_id)
+                    stats["duplicates_skipped"] += 1
+                    continue
 
                 try:
                     # Extract data from the listing card container
                     listing_data = self._extract_listing_data(container)
+                except Exception as e:
+                    logger.error(f"Error processing listing {listing_id}: {e}")
+                    stats["errors"] += 1
+                    if not skip_errors:
+                        raise
+                    # Continue to next listing if skip_errors is True
+                    continue
+
+                if listing_data:
+                    existing_ids.add(listing_id)
+                    if not self._claim_listing(listing_id):
+                        logger.debug("Skipping duplicate listing: %s", listing_id)
+                        stats["duplicates_skipped"] += 1
+                        continue
+                    cards.append((listing_id, listing_url, listing_data))
+
+            # Fetch additional details from the individual listing pages
+            details = self._fetch_details([listing_url for _, listing_url, _ in cards])
+
+            new_listings: List[Listing] = []
+            for (listing_id, listing_url, listing_data), detail_data in zip(
+                cards, details
+            ):
+                try:
+                    # Merge card data with detail data
+                    if detail_data:
+                        listing_data.update(detail_data)
+
+                    # Create listing object
+                    listing = Listing(
+                        id=listing_id,
+                        url=listing_url,
+                        title=listing_data.get("title", "No title"),
+                        price=listing_data.get("price"),
+                        price_period=listing_data.get("price_period"),
+                        start_date=listing_data.get("start_date"),
+                        end_date=listing_data.get("end_date"),
+                        neighborhood=listing_data.get("neighborhood"),
+                        brief_description=listing_data.get("description"),
+                        full_description=listing_data.get("full_description"),
+                        contact_name=listing_data.get("name"),
+                        contact_email=listing_data.get("email"),
+                        listing_type=ListingType.SUBLET,
+                        source_site=source_name,
+                    )
 
-                    if listing_data:
-                        # Fetch additional details from the individual listing page
-                        detail_data = self._fetch_and_extract_details(
-                            f"{self.BASE_URL}{href}"
-                        )
-
-                        # Merge card data with detail data
-                        if detail_data:
-                            listing_data.update(detail_data)
-
-                        # Create listing object
-                        listing = Listing(
-                            id=listing_id,
-                            url=f"{self.BASE_URL}{href}",
-                            title=listing_data.get("title", "No title"),
-                            price=listing_data.get("price"),
-                            price_period=listing_data.get("price_period"),
-                            start_date=listing_data.get("start_date"),
-                            end_date=listing_data.get("end_date"),
-                            neighborhood=listing_data.get("neighborhood"),
-                            brief_description=listing_data.get("description"),
-                            full_description=listing_data.get("full_description"),
-                            contact_name=listing_data.get("name"),
-                            contact_email=listing_data.get("email"),
-                            listing_type=ListingType.SUBLET,
-                            source_site=self.get_source_name(),
-                        )
-
-                        # Store directly to database
-                        try:
-                            with get_db_manager().get_session() as db:
-                                db: Session
-                                db.add(listing)
-                                db.commit()
-                                page_new_count += 1
-                                stats["new_listings"] += 1
-                                print(f"Stored listing: {listing_id}")
-                        except Exception as e:
-                            print(f"Failed to store listing {listing_id}: {e}")
-                            stats["errors"] += 1
-
-                        # Rate limiting between listings
-                        if self.config.delay_between_listings > 0:
-                            time.sleep(self.config.delay_between_listings)
+                    # Stored with the rest of the page below
+                    new_listings.append(listing)
 
                 except Exception as e:
-                    print(f"Error processing listing {listing_id}: {e}")
+                    logger.error(f"Error processing listing {listing_id}: {e}")
                     stats["errors"] += 1
-                    if not self.config.skip_errors:
+                    if not skip_errors:
                         raise
                     # Continue to next listing if skip_errors is True
 
-            print(
+            # Store the page's new listings in one transaction
+            page_new_count = self._store_page_listings(new_listings)
+            stats["new_listings"] += page_new_count
+            stats["errors"] += len(new_listings) - page_new_count
+
+            logger.info(
                 f"Found {len(listing_containers)} containers on page {page_num}, stored {page_new_count} new listings"
             )
 
             # Rate limiting between pages (except for the last page)
-            if page_num < max(pages_to_fetch) and self.config.delay_between_pages > 0:
+            if page_num < last_page and self.config.delay_between_pages > 0:
                 time.sleep(self.config.delay_between_pages)
 
-        print(f"Scraping complete. Stats: {stats}")
+        logger.info(f"Scraping complete. Stats: {stats}")
         return stats
 
+    def _claim_listing(self, listing_id: str) -> bool:
+        """Claim a new listing for this thread, False if another got it first"""
+        with self._claim_lock:
+            if listing_id in self._claimed_ids:
+                return False
+            self._claimed_ids.add(listing_id)
+            return True
+
+    def _existing_listing_ids(self, listing_ids: List[str]) -> Set[str]:
+        """Return which of the given listing IDs are already stored"""
+        if not listing_ids:
+            return set()
+
+        with get_db_manager().get_session() as db:
+            db: Session
+            rows = db.query(Listing.id).filter(Listing.id.in_(listing_ids)).all()
+            return {row[0] for row in rows}
+
+    def _store_page_listings(self, listings: List[Listing]) -> int:
+        """Store a page of new listings with one commit
+
+        Falls back to storing them one at a time if the batch fails, so one
+        bad row doesn't drop the rest of the page.
+
+        Returns:
+            Number of listings stored
+        """
+        if not listings:
+            return 0
+
+        listing_ids = [listing.id for listing in listings]
+        try:
+            with get_db_manager().get_session() as db:
+                db: Session
+                db.add_all(listings)
+                db.commit()
+            logger.debug("Stored %d listings: %s", len(listing_ids), listing_ids)
+            return len(listing_ids)
+        except Exception as e:
+            logger.warning(f"Batch store failed, storing listings individually: {e}")
+
+        stored = 0
+        for listing, listing_id in zip(listings, listing_ids):
+            try:
+                with get_db_manager().get_session() as db:
+                    db: Session
+                    db.add(listing)
+                    db.commit()
+                stored += 1
+                logger.debug("Stored listing: %s", listing_id)
+            except Exception as e:
+                logger.error(f"Failed to store listing {listing_id}: {e}")
+        return stored
+
     def _extract_listing_data(self, listing_element: Any) -> Optional[Dict[str, Any]]:
-        """Extract data from a listing card element (the <a> tag containing all card info)"""
+        """Extract data from a listing card element (the lxml div containing all card info)"""
         try:
             # Extract title from h4 tag
             title = None
-            h4 = listing_element.find("h4")
+            h4 = _CARD_TITLE_XPATH(listing_element)
             if h4:
-                title = h4.get_text(strip=True)
+                title = _element_text(h4[0])
 
-            # Get all text content for parsing
-            full_text = listing_element.get_text(" ", strip=True)
+            # Walk the card's text once and parse every field from it
+            text_parts = _stripped_strings(listing_element)
+            full_text = " ".join(text_parts)
 
-            # Extract price using element selectors
-            price, price_period = self._extract_price_from_element(listing_element)
+            # Extract price from the text fragments
+            price, price_period = self._extract_price(text_parts)
 
-            # Extract dates using element selectors
-            start_date, end_date = self._extract_dates_from_element(listing_element)
+            # Extract dates from the card text
+            start_date, end_date = self._extract_dates(full_text)
 
             # Extract neighborhood from title
             neighborhood = self._extract_neighborhood_form_element(listing_element)
 
             # Brief description (text after filtering out structured data)
-            description = self._extract_brief_description(
-                listing_element, title, full_text
-            )
+            description = self._extract_brief_description(text_parts, title)
 
             return {
                 "title": title,
@@ -304,88 +514,65 @@ class ListingProjectIngestor(BaseIngestor):
             }
 
         except Exception as e:
-            print(f"Error extracting listing data: {e}")
+            logger.error(f"Error extracting listing data: {e}")
             return None
 
     def _extract_neighborhood_form_element(self, element: Any) -> str:
         """Extract neigboorhood information from element"""
-        elem = element.select_one("div.text-grey-dark.font-semibold.text-smish")
-        if elem is None:
+        elems = _CARD_NEIGHBORHOOD_XPATH(element)
+        if not elems:
             return ""
-        text = elem.get_text(strip=True).split("|")[0]
+        text = _element_text(elems[0]).split("|")[0]
         return "".join(text.split())
 
-    def _extract_price_from_element(
-        self, element: Any
+    def _extract_price(
+        self, text_parts: List[str]
     ) -> tuple[Optional[float], Optional[Any]]:
-        """Extract price from specific elements in the listing card"""
-        # Look for text containing $ symbol in any element
-        for text_elem in element.find_all(string=re.compile(r"\$")):
-            text = str(text_elem).strip()
-            price_match = re.search(
-                r"\$\s?([\d,]+)(?:\s?/\s?(month|mo|week|wk|day|night))?",
-                text,
-                re.IGNORECASE,
-            )
+        """Extract price from the listing card's text fragments"""
+        # Look for text containing $ symbol
+        for text in text_parts:
+            if "$" not in text:
+                continue
+
+            price_match = _PRICE_RE.search(text)
 
             if price_match:
                 price_str = price_match.group(1).replace(",", "")
-                period = price_match.group(2) if price_match.group(2) else "month"
+                period = price_match.group(2) or "month"
 
                 try:
                     price = float(price_str)
-                    original_period = period.lower()
-
-                    # Normalize to monthly price
-                    if original_period in ["day", "night"]:
-                        return price, PricePeriod.DAY
-                    elif original_period in ["week", "wk"]:
-                        return price, PricePeriod.WEEK
-                    else:
-                        return price, PricePeriod.MONTH
-
+                    return price, _PRICE_PERIODS.get(period.lower(), PricePeriod.MONTH)
                 except ValueError:
                     continue
 
         return None, None
 
-    def _extract_dates_from_element(
-        self, element: Any
-    ) -> tuple[Optional[Any], Optional[Any]]:
-        """Extract dates from the specific date span element"""
-        from dateutil import parser
-
-        # Look for the specific date span with bg-teal-light class
-        full_text = element.get_text(" ", strip=True)
+    def _extract_dates(self, full_text: str) -> tuple[Optional[Any], Optional[Any]]:
+        """Extract the date range from the listing card's text"""
         if full_text:
             # Look for date range pattern: "July 1, 2025 - August 26, 2025"
-            date_range_pattern = (
-                r"([A-Za-z]+ \d{1,2},? \d{4})\s*[-–]\s*([A-Za-z]+ \d{1,2},? \d{4})"
-            )
-            match = re.search(date_range_pattern, full_text)
+            match = _DATE_RANGE_RE.search(full_text)
 
             if match:
                 try:
-                    start_date = parser.parse(match.group(1))
-                    end_date = parser.parse(match.group(2))
+                    start_date = _parse_card_date(match.group(1))
+                    end_date = _parse_card_date(match.group(2))
                     return start_date, end_date
-                except Exception:
+                except (KeyError, ValueError):
                     pass
 
         return None, None
 
     def _extract_brief_description(
-        self, element: Any, title: Optional[str], full_text: str
+        self, text_parts: List[str], title: Optional[str]
     ) -> Optional[str]:
-        """Extract brief description from listing card"""
-        # Get all text strings from the element
-        text_parts: list[str] = []
-
-        for text in element.stripped_strings:
-            text = text.strip()
-            if not text:
-                continue
+        """Extract brief description from the listing card's text fragments"""
+        description_parts: list[str] = []
+        # Length of the parts joined with single spaces
+        length = -1
 
+        for text in text_parts:
             # Skip if it's the title
             if title and text == title:
                 continue
@@ -393,19 +580,22 @@ class ListingProjectIngestor(BaseIngestor):
             if "$" in text:
                 continue
             # Skip if it looks like a date (contains 4-digit year)
-            if re.search(r"\b20\d{2}\b", text):
+            if _YEAR_RE.search(text):
                 continue
             # Skip very short fragments
             if len(text) < 10:
                 continue
 
-            text_parts.append(text)
+            # Collapse inner whitespace as each part is added
+            part = " ".join(text.split())
+            description_parts.append(part)
+            length += len(part) + 1
 
-        # Join and clean up
-        description = " ".join(text_parts)
+            # Anything past 200 characters is truncated anyway
+            if length > 200:
+                break
 
-        # Remove extra whitespace
-        description = re.sub(r"\s+", " ", description).strip()
+        description = " ".join(description_parts)
 
         # Truncate if too long
         if len(description) > 200:
@@ -413,35 +603,59 @@ class ListingProjectIngestor(BaseIngestor):
 
         return description if description and len(description) > 20 else None
 
+    def _fetch_details(self, listing_urls: List[str]) -> List[Dict[str, Any]]:
+        """Fetch listing detail pages concurrently, in the order given
+
+        The pages are independent, I/O-bound GETs, so they share the session's
+        connection pool across a small thread pool. delay_between_listings
+        still spaces out when each request starts.
+        """
+        if not listing_urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.config.detail_workers) as executor:
+            return list(executor.map(self._fetch_details_throttled, listing_urls))
+
+    def _fetch_details_throttled(self, listing_url: str) -> Dict[str, Any]:
+        """Wait for the next request slot, then fetch one detail page"""
+        delay = self.config.delay_between_listings
+        if delay > 0:
+            with self._fetch_lock:
+                now = time.monotonic()
+                wait = self._next_fetch_at - now
+                self._next_fetch_at = max(now, self._next_fetch_at) + delay
+            if wait > 0:
+                time.sleep(wait)
+
+        return self._fetch_and_extract_details(listing_url)
+
     def _fetch_and_extract_details(self, listing_url: str) -> Dict[str, Any]:
         """Fetch individual listing page and extract detailed information"""
         try:
-            print(f"Fetching details from: {listing_url}")
+            logger.debug("Fetching details from: %s", listing_url)
 
             # Fetch the individual listing page
             response = self.session.get(listing_url, timeout=30)
             response.raise_for_status()
 
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Only three fields are needed, so query them directly
+            page = lxml_html.fromstring(response.text)
 
-            div = soup.find("div", class_="text-grey-darkest")
+            divs = _DETAIL_DESCRIPTION_XPATH(page)
 
             # Extract full description using html_to_clean_text for LLM processing
-            full_description = div.getText(" ", strip=True) if div else ""
+            full_description = _element_text(divs[0], " ") if divs else ""
 
             name = None
             email = None
 
-            name_div = soup.find("strong", string="Name:")
-            if name_div:
-                name_span = name_div.find_next_sibling("span")
-                if name_span:
-                    name = name_span.get_text(strip=True)
+            name_spans = _DETAIL_NAME_XPATH(page)
+            if name_spans:
+                name = _element_text(name_spans[0])
 
-            email_link = soup.find("a", class_="contact__a")
-            if email_link:
-                email = email_link.get_text(strip=True)
+            email_links = _DETAIL_EMAIL_XPATH(page)
+            if email_links:
+                email = _element_text(email_links[0])
 
             return {
                 "full_description": full_description,
@@ -451,34 +665,31 @@ class ListingProjectIngestor(BaseIngestor):
             }
 
         except Exception as e:
-            print(f"Error fetching details from {listing_url}: {e}")
+            logger.warning(f"Error fetching details from {listing_url}: {e}")
             return {"detail_fetched": False}
 
     def _login(self, email: str, password: str) -> bool:
         """Authenticate with the Listings Project website"""
         try:
-            print(f"Attempting to login with email: {email}")
+            logger.info(f"Attempting to login with email: {email}")
 
             # Step 1: Get login page to extract CSRF token
             login_page_url = f"{self.BASE_URL}/user_sessions"
             response = self.session.get(login_page_url)
             response.raise_for_status()
 
-            # Parse the login page to extract authenticity token
-            soup = BeautifulSoup(response.text, "html.parser")
-            token_input = soup.find("input", {"name": "authenticity_token"})
+            # Pull the authenticity token out of the markup; the rest of the
+            # login page isn't needed, so it isn't parsed
+            token_input = _AUTH_TOKEN_INPUT_RE.search(response.text)
 
-            if not token_input or not isinstance(token_input, Tag):
-                print("Could not find authenticity token on login page")
+            if not token_input:
+                logger.error("Could not find authenticity token on login page")
                 return False
 
-            authenticity_token = token_input.get("value")
-            if isinstance(authenticity_token, list):
-                authenticity_token = authenticity_token[0] if authenticity_token else ""
-            elif authenticity_token is None:
-                authenticity_token = ""
+            token_value = _VALUE_ATTR_RE.search(token_input.group(0))
+            authenticity_token = unescape(token_value.group(1)) if token_value else ""
 
-            print(f"Extracted authenticity token: {authenticity_token[:20]}...")
+            logger.debug("Extracted authenticity token: %s...", authenticity_token[:20])
 
             # Step 2: Submit login credentials
             login_data: Dict[str, str] = {
@@ -496,17 +707,19 @@ class ListingProjectIngestor(BaseIngestor):
             if response.status_code in [200, 302]:
                 # Check if we got authentication cookies
                 if "user_credentials" in self.session.cookies:
-                    print("Login successful - authentication cookies received")
+                    logger.info("Login successful - authentication cookies received")
                     return True
                 else:
-                    print("Login may have failed - no user_credentials cookie found")
+                    logger.warning(
+                        "Login may have failed - no user_credentials cookie found"
+                    )
                     return False
             else:
-                print(f"Login failed with status code: {response.status_code}")
+                logger.error(f"Login failed with status code: {response.status_code}")
                 return False
 
         except Exception as e:
-            print(f"Login error: {e}")
+            logger.error(f"Login error: {e}")
             return False
 
     def sync(self) -> SyncResult:
@@ -519,16 +732,24 @@ class ListingProjectIngestor(BaseIngestor):
                 "pages_processed": 0,
             }
 
-            for city in self.config.supported_cities:
-                print(f"Starting sync for city: {city}")
-                city_stats = self.store_listings(
-                    city=city,
-                )
+            cities = self.config.supported_cities
+            with self._claim_lock:
+                self._claimed_ids.clear()
+            # Cities are scraped side by side; detail requests still share
+            # the delay_between_listings schedule across all of them
+            with ThreadPoolExecutor(max_workers=max(len(cities), 1)) as executor:
+                futures: Dict[str, Future[Dict[str, int]]] = {}
+                for city in cities:
+                    logger.info(f"Starting sync for city: {city}")
+                    futures[city] = executor.submit(self.store_listings, city=city)
+
+            for city, future in futures.items():
+                city_stats = future.result()
 
                 for key in total_stats:
                     total_stats[key] += city_stats.get(key, 0)
 
-                print(
+                logger.info(
                     f"Completed sync for {city}: {city_stats.get('new_listings', 0)} new listings"
                 )
 
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -12,6 +12,10 @@ class ListingEvaluation(Base):
     """Database model for storing LLM evaluations of listings for users"""
 
     __tablename__ = "listing_evaluations"
+    __table_args__ = (
+        # Candidate and recommendation queries look up evaluations per user
+        Index("ix_listing_evaluations_user_id_listing_id", "user_id", "listing_id"),
+    )
 
     # Primary key
     id: Mapped[str] = mapped_column(
@@ -209,11 +209,11 @@ def evaluate_user_listings(self: Any, user_id: str) -> Dict[str, Any]:
 
 def handle_sync_listings(task: Task) -> Dict[str, Any]:
     """Handle listing sync task - syncs all enabled sources"""
-    from src.ingestors.ingestor import ingestor
+    from src.ingestors.ingestor import get_ingestor
 
     try:
         logger.info("Starting sync for all enabled sources")
-        results = ingestor.sync_all_enabled()
+        results = get_ingestor().sync_all_enabled()
 
         # Aggregate stats across all sources
         total_new_listings = sum(result.new_listings for result in results.values())
@@ -0,0 +1,77 @@
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+
+from src.agents.message_formatter import (
+    ChatMessage,
+    ChatToolCall,
+    MessageHistoryFormatter,
+)
+
+
+class TestMessageHistoryFormatter:
+    """Test conversion of pydantic-ai history into chat messages"""
+
+    def test_formats_user_and_assistant_messages(self):
+        """Test prompts, text parts and tool calls are all formatted"""
+        messages = [
+            ModelRequest(parts=[UserPromptPart(content="Find me a studio")]),
+            ModelResponse(
+                parts=[
+                    TextPart(content="Sure."),
+                    ToolCallPart(tool_name="update_user_preferences", args="{}"),
+                    TextPart(content="Saved your preferences."),
+                ]
+            ),
+        ]
+
+        history = MessageHistoryFormatter().format_history(messages)
+
+        assert history == [
+            ChatMessage(role="user", content="Find me a studio"),
+            ChatMessage(
+                role="assistant",
+                content="Sure. Saved your preferences.",
+                tool_calls=[
+                    ChatToolCall(tool_name="update_user_preferences", args="{}")
+                ],
+            ),
+        ]
+
+    def test_skips_tool_return_requests(self):
+        """Test requests that only carry tool results are not shown"""
+        messages = [
+            ModelRequest(
+                parts=[
+                    ToolReturnPart(
+                        tool_name="update_user_preferences",
+                        content="ok",
+                        tool_call_id="call-1",
+                    )
+                ]
+            ),
+        ]
+
+        assert MessageHistoryFormatter().format_history(messages) == []
+
+    def test_truncates_content_and_args(self):
+        """Test content and tool args respect the truncation limits"""
+        messages = [
+            ModelResponse(
+                parts=[
+                    TextPart(content="a" * 20),
+                    ToolCallPart(tool_name="search", args="b" * 20),
+                ]
+            ),
+        ]
+
+        formatter = MessageHistoryFormatter(truncate_content=10, truncate_args=8)
+        (message,) = formatter.format_history(messages)
+
+        assert message.content == "aaaaaaa..."
+        assert message.tool_calls == [ChatToolCall(tool_name="search", args="bbbbb...")]
@@ -0,0 +1,136 @@
+from pydantic_ai.messages import (
+    FinalResultEvent,
+    ModelRequest,
+    ModelResponse,
+    PartDeltaEvent,
+    PartStartEvent,
+    SystemPromptPart,
+    TextPart,
+    TextPartDelta,
+    ToolCallPart,
+    ToolCallPartDelta,
+    ToolReturnPart,
+    UserPromptPart,
+)
+
+from src.agents.stream_events import TextChunkEvent, TextStartEvent, ToolCallEvent
+from src.agents.user_agent import UserAgent, _to_stream_event, _truncate_history
+from src.models.user import User
+from src.models.user_session import UserSession
+
+
+def _turn(prompt: str, reply: str) -> list:
+    return [
+        ModelRequest(parts=[UserPromptPart(content=prompt)]),
+        ModelResponse(parts=[TextPart(content=reply)]),
+    ]
+
+
+class TestToStreamEvent:
+    def test_text_part_start(self):
+        """Test a starting text part becomes a text start event"""
+        event = PartStartEvent(index=0, part=TextPart(content="Hi"))
+
+        assert _to_stream_event(event) == TextStartEvent(content="Hi")
+
+    def test_tool_call_part_start(self):
+        """Test a starting tool call exposes only the tool name"""
+        event = PartStartEvent(
+            index=0, part=ToolCallPart(tool_name="update_user_preferences", args="{}")
+        )
+
+        assert _to_stream_event(event) == ToolCallEvent(
+            tool_name="update_user_preferences"
+        )
+
+    def test_text_delta(self):
+        """Test text deltas become text chunk events"""
+        event = PartDeltaEvent(index=0, delta=TextPartDelta(content_delta=" there"))
+
+        assert _to_stream_event(event) == TextChunkEvent(content=" there")
+
+    def test_unexposed_events_skipped(self):
+        """Test tool call arg deltas and other events are not streamed"""
+        tool_delta = PartDeltaEvent(
+            index=0, delta=ToolCallPartDelta(args_delta='{"max_price"')
+        )
+        final = FinalResultEvent(tool_name=None, tool_call_id=None)
+
+        assert _to_stream_event(tool_delta) is None
+        assert _to_stream_event(final) is None
+
+
+class TestTruncateHistory:
+    def test_short_history_is_unchanged(self):
+        """Test history within budget is passed through as-is"""
+        messages = _turn("hi", "hello") + _turn("find me a place", "sure")
+
+        assert _truncate_history(messages, max_tokens=1000) is messages
+
+    def test_keeps_first_and_latest_turns(self):
+        """Test oldest middle turns are dropped first"""
+        first = [
+            ModelRequest(
+                parts=[SystemPromptPart(content="system"), UserPromptPart(content="")]
+            ),
+            ModelResponse(parts=[TextPart(content="Welcome!")]),
+        ]
+        middle = _turn("a" * 400, "b" * 400)
+        latest = _turn("latest question", "latest answer")
+
+        truncated = _truncate_history(first + middle + latest, max_tokens=50)
+
+        assert truncated == first + latest
+
+    def test_tool_call_and_result_dropped_together(self):
+        """Test tool call/return pairs are never split"""
+        tool_turn = [
+            ModelRequest(parts=[UserPromptPart(content="update my budget " * 20)]),
+            ModelResponse(
+                parts=[
+                    ToolCallPart(
+                        tool_name="update_user_preferences",
+                        args={"preferences": {"max_price": 3000}},
+                        tool_call_id="call_1",
+                    )
+                ]
+            ),
+            ModelRequest(
+                parts=[
+                    ToolReturnPart(
+                        tool_name="update_user_preferences",
+                        content={"success": True},
+                        tool_call_id="call_1",
+                    )
+                ]
+            ),
+            ModelResponse(parts=[TextPart(content="Updated!")]),
+        ]
+        first = _turn("hi", "hello")
+        latest = _turn("thanks", "anytime")
+
+        truncated = _truncate_history(first + tool_turn + latest, max_tokens=20)
+
+        assert truncated == first + latest
+
+
+class TestSaveMessageHistory:
+    def test_saves_after_request_session_closed(self, clean_database):
+        """Test history persists when the db session closed before streaming"""
+        with clean_database.get_session() as db:
+            user = User(id="agent_user", first_name="Test", last_name="User")
+            db.add(user)
+            db.commit()
+
+            agent = UserAgent(db_session=db, user=user)
+
+            # get_db closes the session before StreamingResponse runs chat()
+            db.close()
+
+            agent._message_history = _turn("hi", "hello")
+            agent._save_message_history()
+
+        with clean_database.get_session() as db:
+            stored = db.query(UserSession).filter_by(user_id="agent_user").one()
+            assert stored.message_history is not None
+            assert len(stored.message_history) == 2
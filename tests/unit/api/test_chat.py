@@ -0,0 +1,85 @@
+import asyncio
+import json
+from unittest.mock import Mock
+
+from sqlalchemy.exc import OperationalError
+
+from src.agents.message_formatter import ChatMessage, ChatToolCall
+from src.api.routes.chat import _encode_history_ndjson, send_message
+from src.api.schemas.chat import ChatMessageRequest
+from src.models.user import User
+
+
+class TestEncodeHistoryNdjson:
+    """Test the NDJSON encoding used by the streaming history endpoint"""
+
+    def test_one_line_per_message(self):
+        """Test each message is encoded as its own JSON line"""
+        messages = [
+            ChatMessage(role="user", content="Looking for a studio"),
+            ChatMessage(
+                role="assistant",
+                content="Noted!",
+                tool_calls=[
+                    ChatToolCall(
+                        tool_name="update_user_preferences", args="{'max_price': 2000}"
+                    )
+                ],
+            ),
+        ]
+
+        lines = list(_encode_history_ndjson(messages))
+
+        assert all(line.endswith(b"\n") for line in lines)
+        assert [json.loads(line) for line in lines] == [
+            {
+                "role": "user",
+                "content": "Looking for a studio",
+                "tool_calls": None,
+                "timestamp": None,
+            },
+            {
+                "role": "assistant",
+                "content": "Noted!",
+                "tool_calls": [
+                    {
+                        "tool_name": "update_user_preferences",
+                        "args": "{'max_price': 2000}",
+                    }
+                ],
+                "timestamp": None,
+            },
+        ]
+
+    def test_empty_history(self):
+        """Test an empty history produces an empty body"""
+        assert list(_encode_history_ndjson([])) == []
+
+
+class TestSendMessage:
+    """Test error responses from the chat message endpoint"""
+
+    def test_session_commit_failure_is_sse_error(self):
+        """Test a failed chat session commit is answered with an SSE error frame"""
+        session = Mock()
+        session.get.return_value = None
+        session.commit.side_effect = OperationalError("INSERT", {}, Exception("gone"))
+
+        async def send():
+            response = await send_message(
+                ChatMessageRequest(message="hi"),
+                current_user=Mock(spec=User, id="user-1"),
+                session=session,
+            )
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            return response, body
+
+        response, body = asyncio.run(send())
+
+        session.rollback.assert_called_once()
+        assert response.status_code == 500
+        assert response.media_type == "text/event-stream"
+        assert body.startswith(b"data: ")
+        frame = json.loads(body[len(b"data: ") :])
+        assert frame["type"] == "agent_error"
+        assert frame["error"].startswith("Agent processing failed")
@@ -0,0 +1,216 @@
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.api import deps
+from src.api.deps import get_current_user
+from src.models.user import User
+
+JWT_SECRET = "test-supabase-jwt-secret-at-least-32-bytes"
+OTHER_SECRET = "some-other-projects-jwt-secret-32-bytes"
+
+
+def _make_token(expires_in: int = 3600, secret: str = OTHER_SECRET, **claims: Any):
+    """Mint an HS256 Supabase-style access token"""
+    payload = {
+        "sub": "auth-123",
+        "aud": "authenticated",
+        "exp": int(time.time()) + expires_in,
+        **claims,
+    }
+    return jwt.encode(payload, secret, algorithm="HS256")
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _supabase_client() -> Mock:
+    """Mock AsyncClient whose auth.get_user resolves a Supabase user"""
+    client = Mock()
+    client.auth.get_user = AsyncMock(
+        return_value=Mock(
+            user=Mock(
+                id="auth-123",
+                user_metadata={"firstName": "Ada", "lastName": "Lovelace"},
+            )
+        )
+    )
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    deps._validated_tokens.clear()
+    yield
+    deps._validated_tokens.clear()
+
+
+@pytest.fixture
+def user_service():
+    """Patch UserService so find_or_create_user returns a known user"""
+    with patch("src.api.deps.UserService") as service_class:
+        service = service_class.return_value
+        service.find_or_create_user.return_value = Mock(spec=User, id="user-1")
+        yield service
+
+
+class TestGetCurrentUser:
+    """Test token validation and caching in get_current_user"""
+
+    @pytest.fixture(autouse=True)
+    def no_jwt_secret(self):
+        with patch.object(deps.settings, "supabase_jwt_secret", None):
+            yield
+
+    def test_expired_token_rejected_without_network(self, user_service):
+        """Test expired tokens are rejected before calling Supabase"""
+        supabase = _supabase_client()
+        token = _make_token(expires_in=-10)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_current_user(_credentials(token), supabase, Mock()))
+
+        assert exc_info.value.status_code == 401
+        supabase.auth.get_user.assert_not_awaited()
+        user_service.find_or_create_user.assert_not_called()
+
+    def test_cache_hit_skips_supabase_and_find_or_create(self, user_service):
+        """Test a repeat token loads the user by id instead of revalidating"""
+        supabase = _supabase_client()
+        session = Mock()
+        cached_user = Mock(spec=User, id="user-1")
+        session.get.return_value = cached_user
+        token = _make_token()
+
+        first = asyncio.run(get_current_user(_credentials(token), supabase, session))
+        second = asyncio.run(get_current_user(_credentials(token), supabase, session))
+
+        assert first.id == "user-1"
+        assert second is cached_user
+        supabase.auth.get_user.assert_awaited_once()
+        user_service.find_or_create_user.assert_called_once()
+        session.get.assert_called_once_with(User, "user-1")
+
+    def test_deleted_cached_user_falls_back_to_full_validation(self, user_service):
+        """Test a cached id whose user no longer exists is revalidated"""
+        supabase = _supabase_client()
+        session = Mock()
+        session.get.return_value = None
+        token = _make_token()
+
+        asyncio.run(get_current_user(_credentials(token), supabase, session))
+        user = asyncio.run(get_current_user(_credentials(token), supabase, session))
+
+        assert user.id == "user-1"
+        assert supabase.auth.get_user.await_count == 2
+        assert user_service.find_or_create_user.call_count == 2
+
+    def test_cache_ttl_capped_at_token_expiry(self, user_service):
+        """Test a token is never cached past its exp claim"""
+        supabase = _supabase_client()
+        token = _make_token(expires_in=10)
+
+        with patch.object(
+            deps._validated_tokens, "set", wraps=deps._validated_tokens.set
+        ) as cache_set:
+            asyncio.run(get_current_user(_credentials(token), supabase, Mock()))
+
+        ttl = cache_set.call_args.kwargs["ttl"]
+        assert 0 < ttl <= 10
+
+    def test_invalid_supabase_user_rejected(self, user_service):
+        """Test tokens Supabase doesn't recognise return 401"""
+        supabase = _supabase_client()
+        supabase.auth.get_user.return_value = Mock(user=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_current_user(_credentials(_make_token()), supabase, Mock()))
+
+        assert exc_info.value.status_code == 401
+        user_service.find_or_create_user.assert_not_called()
+
+
+def _unsigned_rs256_token() -> str:
+    """Build a token whose header claims RS256 (signature is never checked)"""
+    header = jwt.utils.base64url_encode(b'{"alg":"RS256","typ":"JWT"}').decode()
+    payload = jwt.utils.base64url_encode(
+        f'{{"sub":"auth-123","aud":"authenticated","exp":{int(time.time()) + 3600}}}'.encode()
+    ).decode()
+    return f"{header}.{payload}.c2lnbmF0dXJl"
+
+
+class TestLocalTokenVerification:
+    """Test get_current_user verifying tokens with the Supabase JWT secret"""
+
+    @pytest.fixture(autouse=True)
+    def jwt_secret(self):
+        with patch.object(deps.settings, "supabase_jwt_secret", JWT_SECRET):
+            yield
+
+    def test_valid_token_resolved_from_claims(self, user_service):
+        """Test a valid HS256 token is resolved without calling Supabase"""
+        supabase = _supabase_client()
+        token = _make_token(
+            secret=JWT_SECRET,
+            sub="auth-local",
+            user_metadata={"firstName": "Grace", "lastName": "Hopper"},
+        )
+
+        user = asyncio.run(get_current_user(_credentials(token), supabase, Mock()))
+
+        assert user.id == "user-1"
+        supabase.auth.get_user.assert_not_awaited()
+        user_data = user_service.find_or_create_user.call_args.args[0]
+        assert user_data.auth_user_id == "auth-local"
+        assert user_data.first_name == "Grace"
+        assert user_data.last_name == "Hopper"
+
+    def test_wrong_secret_falls_back_to_supabase(self, user_service):
+        """Test a token signed with another key is validated remotely"""
+        supabase = _supabase_client()
+        token = _make_token(secret=OTHER_SECRET)
+
+        asyncio.run(get_current_user(_credentials(token), supabase, Mock()))
+
+        supabase.auth.get_user.assert_awaited_once_with(jwt=token)
+        user_data = user_service.find_or_create_user.call_args.args[0]
+        assert user_data.auth_user_id == "auth-123"
+
+    def test_asymmetric_token_falls_back_to_supabase(self, user_service):
+        """Test an RS256 token is validated remotely"""
+        supabase = _supabase_client()
+        token = _unsigned_rs256_token()
+
+        asyncio.run(get_current_user(_credentials(token), supabase, Mock()))
+
+        supabase.auth.get_user.assert_awaited_once_with(jwt=token)
+
+    def test_wrong_audience_rejected(self, user_service):
+        """Test a correctly signed token for another audience returns 401"""
+        supabase = _supabase_client()
+        token = _make_token(secret=JWT_SECRET, aud="anon")
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_current_user(_credentials(token), supabase, Mock()))
+
+        assert exc_info.value.status_code == 401
+        supabase.auth.get_user.assert_not_awaited()
+        user_service.find_or_create_user.assert_not_called()
+
+    def test_expired_token_rejected(self, user_service):
+        """Test a correctly signed but expired token returns 401"""
+        supabase = _supabase_client()
+        token = _make_token(secret=JWT_SECRET, expires_in=-10)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_current_user(_credentials(token), supabase, Mock()))
+
+        assert exc_info.value.status_code == 401
+        supabase.auth.get_user.assert_not_awaited()
@@ -0,0 +1,106 @@
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.api.middleware import CORSMiddleware, GZipMiddleware
+
+ALLOWED_ORIGIN = "http://localhost:3000"
+
+
+def _app(**response_headers: str) -> Starlette:
+    async def endpoint(request):
+        return PlainTextResponse("ok", headers=response_headers)
+
+    app = Starlette(routes=[Route("/", endpoint, methods=["GET", "POST"])])
+    app.add_middleware(CORSMiddleware, origins=[ALLOWED_ORIGIN])
+    return app
+
+
+@pytest.fixture
+def client():
+    return TestClient(_app())
+
+
+class TestCORSMiddleware:
+    """Test the pure ASGI CORS middleware"""
+
+    def test_request_without_origin_untouched(self, client):
+        """Test same-origin requests get no CORS headers"""
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_allowed_origin_echoed(self, client):
+        """Test an allowed origin is echoed back on simple requests"""
+        response = client.get("/", headers={"Origin": ALLOWED_ORIGIN})
+
+        assert response.text == "ok"
+        assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+        assert response.headers["vary"] == "Origin"
+
+    def test_disallowed_origin_ignored(self, client):
+        """Test origins outside the allow list get no CORS headers"""
+        response = client.get("/", headers={"Origin": "https://evil.example"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight_short_circuits(self, client):
+        """Test preflight requests are answered without reaching the app"""
+        response = client.options(
+            "/",
+            headers={
+                "Origin": ALLOWED_ORIGIN,
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization,content-type",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert (
+            response.headers["access-control-allow-headers"]
+            == "authorization,content-type"
+        )
+
+    def test_existing_allow_origin_header_kept(self):
+        """Test a route's own Access-Control-Allow-Origin is not duplicated"""
+        client = TestClient(_app(**{"Access-Control-Allow-Origin": "*"}))
+
+        response = client.get("/", headers={"Origin": ALLOWED_ORIGIN})
+
+        assert response.headers.get_list("access-control-allow-origin") == ["*"]
+
+
+def _gzip_client() -> TestClient:
+    async def payload(request):
+        return PlainTextResponse("x" * 1024)
+
+    app = Starlette(
+        routes=[Route("/json", payload), Route("/stream", payload)],
+    )
+    app.add_middleware(GZipMiddleware, exclude_paths=("/stream",))
+    return TestClient(app)
+
+
+class TestGZipMiddleware:
+    """Test gzip compression with excluded streaming paths"""
+
+    def test_compresses_large_responses(self):
+        """Test responses over the minimum size are gzipped"""
+        response = _gzip_client().get("/json", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "x" * 1024
+
+    def test_excluded_path_not_compressed(self):
+        """Test streaming paths pass through uncompressed"""
+        response = _gzip_client().get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == "x" * 1024
@@ -0,0 +1,197 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.agents.stream_events import TextChunkEvent, TextStartEvent, ToolCallEvent
+from src.api.utils.sse import (
+    EventStreamResponse,
+    coalesce_events,
+    create_error_stream,
+    format_sse_event,
+    stream_agent_response,
+)
+
+
+def _client() -> TestClient:
+    async def endpoint(request):
+        return EventStreamResponse(create_error_stream("boom"), status_code=500)
+
+    return TestClient(Starlette(routes=[Route("/", endpoint)]))
+
+
+class TestEventStreamResponse:
+    """Test the SSE response class"""
+
+    def test_sends_pre_encoded_headers(self):
+        """Test the SSE headers are sent, including the proxy buffering opt-out"""
+        response = _client().get("/")
+
+        assert response.status_code == 500
+        assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["x-accel-buffering"] == "no"
+
+    def test_streams_body(self):
+        """Test the event stream body is passed through unchanged"""
+        response = _client().get("/")
+
+        assert response.text == 'data: {"type":"error","error":"boom"}\n\n'
+
+
+class TestFormatSseEvent:
+    """Test encoding of a single SSE frame"""
+
+    def test_returns_bytes_frame(self):
+        """Test the frame is bytes with the data prefix and blank-line terminator"""
+        frame = format_sse_event({"type": "error", "error": "boom"})
+
+        assert frame == b'data: {"type":"error","error":"boom"}\n\n'
+
+    def test_encodes_datetime_and_uuid(self):
+        """Test datetimes and UUIDs are encoded natively"""
+        session_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        created = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        frame = format_sse_event({"session_id": session_id, "created": created})
+
+        assert json.loads(frame.removeprefix(b"data: ")) == {
+            "session_id": str(session_id),
+            "created": "2025-01-02T03:04:05+00:00",
+        }
+
+    def test_rejects_unsupported_types(self):
+        """Test values with no JSON form raise instead of being str()-ed"""
+        with pytest.raises(TypeError):
+            format_sse_event({"value": object()})
+
+
+async def _frames(*frames: bytes, delay: float = 0, error: Exception = None):
+    for frame in frames:
+        if delay:
+            await asyncio.sleep(delay)
+        yield frame
+    if error is not None:
+        raise error
+
+
+async def _collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+class TestCoalesceEvents:
+    """Test batching of SSE frames before they are written"""
+
+    def test_burst_is_sent_as_one_chunk(self):
+        """Test frames arriving together are concatenated"""
+        chunks = asyncio.run(_collect(coalesce_events(_frames(b"a", b"b", b"c"))))
+
+        assert chunks == [b"abc"]
+
+    def test_ready_frames_batched_without_delay(self):
+        """Test queued frames are batched even when no delay is allowed"""
+        stream = coalesce_events(_frames(b"a", b"b", b"c"), max_delay=0)
+
+        chunks = asyncio.run(_collect(stream))
+
+        assert chunks == [b"abc"]
+
+    def test_flushes_when_size_reached(self):
+        """Test the buffer is flushed once max_size is reached"""
+        stream = coalesce_events(_frames(b"aa", b"bb", b"cc"), max_size=4)
+
+        chunks = asyncio.run(_collect(stream))
+
+        assert chunks == [b"aabb", b"cc"]
+
+    def test_slow_frames_are_not_held_back(self):
+        """Test a frame is flushed after max_delay even if no more arrive"""
+        stream = coalesce_events(_frames(b"a", b"b", delay=0.05), max_delay=0.005)
+
+        chunks = asyncio.run(_collect(stream))
+
+        assert chunks == [b"a", b"b"]
+
+    def test_source_error_raised_after_flush(self):
+        """Test buffered frames are sent before the source's error surfaces"""
+        received = []
+
+        async def consume():
+            async for chunk in coalesce_events(
+                _frames(b"a", b"b", error=RuntimeError("stream failed"))
+            ):
+                received.append(chunk)
+
+        with pytest.raises(RuntimeError, match="stream failed"):
+            asyncio.run(consume())
+        assert received == [b"ab"]
+
+    def test_producer_pauses_for_slow_client(self):
+        """Test the source is not drained beyond the queue bound"""
+        produced = []
+
+        async def source():
+            for i in range(100):
+                produced.append(i)
+                yield b"x"
+
+        async def read_one_then_stall():
+            stream = coalesce_events(source(), max_size=1, max_queued=4)
+            await stream.__anext__()
+            await asyncio.sleep(0.05)
+            await stream.aclose()
+
+        asyncio.run(read_one_then_stall())
+
+        # One frame read, four queued, one held by the blocked producer
+        assert len(produced) <= 6
+
+    def test_disconnect_cancels_source(self):
+        """Test closing the stream cancels the source so the agent run stops"""
+        cancelled = asyncio.Event()
+
+        async def source():
+            try:
+                yield b"first"
+                await asyncio.sleep(10)
+                yield b"never"
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def disconnect_after_first_chunk():
+            stream = coalesce_events(source())
+            await stream.__anext__()
+            await stream.aclose()
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        asyncio.run(disconnect_after_first_chunk())
+
+        assert cancelled.is_set()
+
+
+class TestStreamAgentResponse:
+    """Test conversion of agent events to SSE frames"""
+
+    def test_events_encoded_and_done_appended(self):
+        """Test each event becomes a JSON frame followed by the done event"""
+
+        async def agent_stream():
+            yield TextStartEvent(content="Hi")
+            yield TextChunkEvent(content=' "there"')
+            yield ToolCallEvent(tool_name="update_user_preferences")
+
+        frames = asyncio.run(_collect(stream_agent_response(agent_stream())))
+
+        assert [json.loads(frame.removeprefix(b"data: ")) for frame in frames] == [
+            {"type": "text_start", "content": "Hi"},
+            {"type": "text_chunk", "content": ' "there"'},
+            {"type": "tool_call", "tool_name": "update_user_preferences"},
+            {"type": "done"},
+        ]
+        assert all(frame.endswith(b"\n\n") for frame in frames)
@@ -0,0 +1,72 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.deps import get_current_user, get_db
+from src.api.routes import user_router
+from src.models.listing import PricePeriod
+from src.models.user import User
+
+
+@pytest.fixture
+def user():
+    return User(
+        id="user-1",
+        first_name="Ada",
+        last_name="Lovelace",
+        price_period=PricePeriod.MONTH,
+        date_flexibility_days=0,
+        preference_version=1,
+        profile_completed=False,
+        evaluation_credits=5.0,
+        created_at=datetime(2025, 1, 1, 12, 0),
+        updated_at=datetime(2025, 1, 2, 12, 0),
+    )
+
+
+@pytest.fixture
+def client(user):
+    app = FastAPI()
+    app.include_router(user_router)
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_db] = lambda: Mock()
+    return TestClient(app)
+
+
+class TestGetUserProfile:
+    """Test the /user/profile endpoint's conditional responses"""
+
+    def test_returns_profile_with_etag(self, client):
+        """Test the profile is returned with an ETag and revalidation headers"""
+        response = client.get("/user/profile")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"user-1-')
+        assert response.headers["cache-control"] == "private, no-cache"
+        body = response.json()
+        assert body["name"] == "Ada Lovelace"
+        assert body["updated_at"] == "2025-01-02T12:00:00"
+        assert body["price_period"] == "month"
+
+    def test_matching_etag_returns_not_modified(self, client):
+        """Test a matching If-None-Match short-circuits with 304"""
+        etag = client.get("/user/profile").headers["etag"]
+
+        response = client.get("/user/profile", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_returns_profile(self, client, user):
+        """Test the profile is resent once the user row has changed"""
+        etag = client.get("/user/profile").headers["etag"]
+        user.updated_at = datetime(2025, 1, 3, 12, 0)
+
+        response = client.get("/user/profile", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+from src.core.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_cached_value(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_entries_expire_after_ttl(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+
+        with patch("src.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=5)
+
+        with patch("src.core.cache.time.monotonic", return_value=110.0):
+            assert cache.get("a") == 1
+            assert cache.get("b") is None
+
+        with patch("src.core.cache.time.monotonic", return_value=161.0):
+            assert cache.get("a") is None
+
+    def test_ttl_override_cannot_exceed_default(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=10)
+
+        with patch("src.core.cache.time.monotonic", return_value=0.0):
+            cache.set("a", 1, ttl=3600)
+
+        with patch("src.core.cache.time.monotonic", return_value=11.0):
+            assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
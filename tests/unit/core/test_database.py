@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from alembic.script import ScriptDirectory
+
+from src.core.database import DatabaseManager
+
+HEAD_REVISION = "4c1e7a9d2f60"
+
+
+def _manager() -> DatabaseManager:
+    # The engine connects lazily, so no database is needed for script lookups
+    return DatabaseManager(database_url="sqlite://")
+
+
+class TestMigrationScripts:
+    def test_script_dir_loaded_once(self):
+        """Test migration scripts are parsed on first use and then reused"""
+        manager = _manager()
+
+        with patch(
+            "src.core.database.ScriptDirectory.from_config",
+            wraps=ScriptDirectory.from_config,
+        ) as from_config:
+            first = manager.script_dir
+            second = manager.script_dir
+
+        assert first is second
+        from_config.assert_called_once()
+
+    def test_head_revision(self):
+        """Test the head revision is read from the migration scripts"""
+        assert _manager().head_revision == HEAD_REVISION
+
+
+class TestPendingMigrations:
+    def test_all_pending_on_empty_database(self):
+        """Test every migration is pending, oldest first, when none are applied"""
+        manager = _manager()
+
+        with patch.object(manager, "get_current_revision", return_value=None):
+            pending = manager.get_pending_migrations()
+
+        assert pending == [
+            "b19f72a13604",
+            "3dd51f46be18",
+            "bb6b2306c35a",
+            HEAD_REVISION,
+        ]
+
+    def test_only_newer_revisions_pending(self):
+        """Test revisions at or below the current one are not pending"""
+        manager = _manager()
+
+        with patch.object(manager, "get_current_revision", return_value="3dd51f46be18"):
+            pending = manager.get_pending_migrations()
+
+        assert pending == ["bb6b2306c35a", HEAD_REVISION]
+
+    def test_nothing_pending_at_head(self):
+        """Test an up to date database has no pending migrations"""
+        manager = _manager()
+
+        with patch.object(manager, "get_current_revision", return_value=HEAD_REVISION):
+            assert manager.get_pending_migrations() == []
+
+
+class TestCheckConnection:
+    def test_reachable_database(self):
+        """Test a reachable database reports a successful connection"""
+        assert _manager().check_connection() is True
+
+    def test_unreachable_database(self):
+        """Test connection errors are reported rather than raised"""
+        manager = DatabaseManager(database_url="sqlite:////nonexistent/dir/db.sqlite")
+
+        assert manager.check_connection() is False
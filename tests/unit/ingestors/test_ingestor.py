@@ -0,0 +1,131 @@
+import os
+import threading
+from unittest.mock import patch
+
+import yaml
+
+from src.ingestors.base_ingestor import SyncResult
+from src.ingestors.ingestor import Ingestor
+
+CONFIG = """
+ingestors:
+  listing_project:
+    defaults:
+      max_pages: 5
+"""
+
+CREDENTIALS_CONFIG = """
+    credentials:
+      email_env_var: "LISTINGS_EMAIL"
+"""
+
+
+class TestIngestorConfig:
+    def test_loads_config_file(self, tmp_path):
+        """Test ingestor configs are read from the YAML file"""
+        config_file = tmp_path / "ingestors.yaml"
+        config_file.write_text(CONFIG)
+
+        ingestor = Ingestor(config_file=str(config_file))
+
+        assert ingestor.get_enabled_sources() == ["listing_project"]
+        assert ingestor.get_source_default_config("listing_project") == {"max_pages": 5}
+
+    def test_relative_path_resolved_once(self, tmp_path, monkeypatch):
+        """Test a relative config path is resolved to an absolute one up front"""
+        (tmp_path / "ingestors.yaml").write_text(CONFIG)
+        monkeypatch.chdir(tmp_path)
+
+        ingestor = Ingestor(config_file="ingestors.yaml")
+
+        assert ingestor._config_path == str(tmp_path / "ingestors.yaml")
+        assert ingestor.get_enabled_sources() == ["listing_project"]
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing config file leaves no sources configured"""
+        ingestor = Ingestor(config_file=str(tmp_path / "missing.yaml"))
+
+        assert ingestor._config_path is None
+        assert ingestor.get_enabled_sources() == []
+
+    def test_unchanged_file_parsed_once(self, tmp_path):
+        """Test re-creating an Ingestor reuses the parsed file"""
+        config_file = tmp_path / "ingestors.yaml"
+        config_file.write_text(CONFIG)
+
+        with patch("src.ingestors.ingestor.yaml.load", wraps=yaml.load) as load:
+            Ingestor(config_file=str(config_file))
+            Ingestor(config_file=str(config_file))
+
+        load.assert_called_once()
+
+    def test_modified_file_reparsed(self, tmp_path):
+        """Test a changed file is parsed again"""
+        config_file = tmp_path / "ingestors.yaml"
+        config_file.write_text(CONFIG)
+        Ingestor(config_file=str(config_file))
+
+        config_file.write_text(CONFIG.replace("max_pages: 5", "max_pages: 10"))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        ingestor = Ingestor(config_file=str(config_file))
+
+        assert ingestor.get_source_default_config("listing_project") == {
+            "max_pages": 10
+        }
+
+    def test_resolved_config_cached(self, tmp_path):
+        """Test credentials are resolved once and callers get their own copy"""
+        config_file = tmp_path / "ingestors.yaml"
+        config_file.write_text(CONFIG + CREDENTIALS_CONFIG)
+        ingestor = Ingestor(config_file=str(config_file))
+
+        with patch.object(
+            ingestor, "_resolve_credentials", return_value={"email": "a@b.c"}
+        ) as resolve:
+            first = ingestor.get_ingestor_config("listing_project")
+            first["max_pages"] = 99
+            second = ingestor.get_ingestor_config("listing_project")
+
+        resolve.assert_called_once()
+        assert second["credentials"] == {"email": "a@b.c"}
+        assert "max_pages" not in second
+
+
+class TestSyncAllEnabled:
+    TWO_SOURCES = """
+ingestors:
+  listing_project: {}
+  other_source: {}
+"""
+
+    def test_sources_synced_concurrently(self, tmp_path):
+        """Test each source runs in its own thread and a failure stays isolated"""
+        config_file = tmp_path / "ingestors.yaml"
+        config_file.write_text(self.TWO_SOURCES)
+        ingestor = Ingestor(config_file=str(config_file))
+        both_started = threading.Barrier(2, timeout=5)
+
+        def sync_source(source_name, sync_params=None):
+            # Only returns once both sources are running at the same time
+            both_started.wait()
+            if source_name == "other_source":
+                raise RuntimeError("site down")
+            return SyncResult(
+                source=source_name,
+                total_processed=1,
+                new_listings=1,
+                duplicates_skipped=0,
+                errors=0,
+                pages_processed=1,
+                success=True,
+            )
+
+        with patch.object(ingestor, "sync_source", side_effect=sync_source):
+            results = ingestor.sync_all_enabled()
+
+        assert list(results) == ["listing_project", "other_source"]
+        assert results["listing_project"].success
+        assert not results["other_source"].success
+        assert results["other_source"].error_message == "site down"
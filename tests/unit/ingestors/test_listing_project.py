@@ -0,0 +1,469 @@
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import requests
+from lxml import html as lxml_html
+
+from src.ingestors.listing_project import (
+    ListingProjectIngestor,
+    ListingProjectIngestorConfig,
+)
+from src.models.listing import Listing, ListingType, PricePeriod
+from tests.fixtures.test_data import create_simple_listing
+
+CARD_HTML = """
+<div class="flex flex-col md:flex-row mb-6">
+  <a href="/listings/sunny-room-1"><h4>Sunny room in Bushwick</h4></a>
+  <div class="text-grey-dark font-semibold text-smish">Bushwick | Brooklyn</div>
+  <span>$1,800 / month</span>
+  <span class="bg-teal-light">July 1, 2025 - August 26, 2025</span>
+  <p>Lovely quiet room with lots of light and plants</p>
+</div>
+"""
+
+DETAIL_HTML = """
+<html><body>
+  <div class="container text-grey-darkest">
+    <p>Sunny room in a <b>quiet</b> apartment.</p>
+    <!-- contact details below -->
+    <p>Close to the L train.</p>
+  </div>
+  <div class="contact">
+    <strong>Name:</strong> <span> Jane Doe </span>
+    <a class="btn contact__a" href="mailto:jane@example.com">jane@example.com</a>
+  </div>
+</body></html>
+"""
+
+
+def _ingestor(**config_overrides) -> ListingProjectIngestor:
+    config = ListingProjectIngestorConfig(
+        supported_cities=["new-york-city"],
+        listing_type=ListingType.SUBLET,
+        max_pages=1,
+        delay_between_pages=0,
+        **config_overrides,
+    )
+    return ListingProjectIngestor(config=config)
+
+
+def _card(html: str) -> lxml_html.HtmlElement:
+    return lxml_html.fragment_fromstring(html.strip())
+
+
+def _listing(listing_id: str) -> Listing:
+    return create_simple_listing(listing_id, 2000.0, PricePeriod.MONTH)
+
+
+class TestExtractListingData:
+    """Test parsing of listing cards"""
+
+    def test_extracts_card_fields(self):
+        """Test title, price, dates and neighborhood are read from a card"""
+        container = _card(CARD_HTML)
+
+        data = _ingestor()._extract_listing_data(container)
+
+        assert data == {
+            "title": "Sunny room in Bushwick",
+            "price": 1800.0,
+            "price_period": PricePeriod.MONTH,
+            "start_date": datetime(2025, 7, 1),
+            "end_date": datetime(2025, 8, 26),
+            "neighborhood": "Bushwick",
+            "description": (
+                "Bushwick | Brooklyn Lovely quiet room with lots of light and plants"
+            ),
+        }
+
+    def test_weekly_price_and_missing_dates(self):
+        """Test the price period is read and absent dates are left empty"""
+        html = CARD_HTML.replace("$1,800 / month", "$450/wk").replace(
+            "July 1, 2025 - August 26, 2025", "Flexible dates"
+        )
+        container = _card(html)
+
+        data = _ingestor()._extract_listing_data(container)
+
+        assert data["price"] == 450.0
+        assert data["price_period"] == PricePeriod.WEEK
+        assert data["start_date"] is None
+        assert data["end_date"] is None
+
+    def test_nightly_price_is_daily(self):
+        """Test per-night prices map to the daily period regardless of case"""
+        html = CARD_HTML.replace("$1,800 / month", "$95 / Night")
+        container = _card(html)
+
+        data = _ingestor()._extract_listing_data(container)
+
+        assert data["price"] == 95.0
+        assert data["price_period"] == PricePeriod.DAY
+
+    def test_abbreviated_months_without_commas(self):
+        """Test short month names and comma-less dates are parsed"""
+        html = CARD_HTML.replace(
+            "July 1, 2025 - August 26, 2025", "Sep 1 2025 – Jan 15, 2026"
+        )
+        container = _card(html)
+
+        data = _ingestor()._extract_listing_data(container)
+
+        assert data["start_date"] == datetime(2025, 9, 1)
+        assert data["end_date"] == datetime(2026, 1, 15)
+
+    def test_unknown_month_ignored(self):
+        """Test a date-shaped phrase that isn't a date leaves dates empty"""
+        html = CARD_HTML.replace(
+            "July 1, 2025 - August 26, 2025", "Room 1, 2025 - Floor 2, 2026"
+        )
+        container = _card(html)
+
+        data = _ingestor()._extract_listing_data(container)
+
+        assert data["start_date"] is None
+        assert data["end_date"] is None
+
+    def test_long_description_truncated(self):
+        """Test descriptions are whitespace-collapsed and cut at 200 characters"""
+        parts = ["Lovely   quiet\n room with light"] * 20
+
+        description = _ingestor()._extract_brief_description(parts, title=None)
+
+        assert len(description) == 200
+        assert description.startswith("Lovely quiet room with light Lovely")
+        assert description.endswith("...")
+
+
+class TestStorePageListings:
+    """Test storing a page of scraped listings"""
+
+    def test_stores_page_in_one_batch(self, clean_database):
+        """Test all new listings on a page are stored"""
+        stored = _ingestor()._store_page_listings([_listing("a"), _listing("b")])
+
+        assert stored == 2
+        with clean_database.get_session() as db:
+            assert {row[0] for row in db.query(Listing.id)} == {"a", "b"}
+
+    def test_failed_batch_falls_back_to_single_rows(self, clean_database):
+        """Test one bad row doesn't drop the rest of the page"""
+        ingestor = _ingestor()
+        ingestor._store_page_listings([_listing("a")])
+
+        stored = ingestor._store_page_listings([_listing("a"), _listing("c")])
+
+        assert stored == 1
+        with clean_database.get_session() as db:
+            assert {row[0] for row in db.query(Listing.id)} == {"a", "c"}
+
+    def test_existing_listing_ids(self, clean_database):
+        """Test only the already stored IDs are returned"""
+        ingestor = _ingestor()
+        ingestor._store_page_listings([_listing("a"), _listing("b")])
+
+        assert ingestor._existing_listing_ids(["a", "b", "z"]) == {"a", "b"}
+        assert ingestor._existing_listing_ids([]) == set()
+
+
+class TestHttpSession:
+    """Test the scraper's HTTP session setup"""
+
+    def test_pool_sized_for_detail_workers(self):
+        """Test every detail worker can hold its own keep-alive connection"""
+        session = _ingestor(detail_workers=12).session
+
+        adapter = session.get_adapter("https://www.listingsproject.com")
+
+        assert adapter._pool_maxsize == 12
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_pool_sized_for_concurrent_cities(self):
+        """Test each concurrently scraped city gets its own detail connections"""
+        config = ListingProjectIngestorConfig(
+            supported_cities=["new-york-city", "boston"],
+            listing_type=ListingType.SUBLET,
+            max_pages=1,
+            delay_between_pages=0,
+            detail_workers=4,
+        )
+        session = ListingProjectIngestor(config=config).session
+
+        adapter = session.get_adapter("https://www.listingsproject.com")
+
+        assert adapter._pool_maxsize == 8
+
+
+class TestStoreListings:
+    """Test page iteration in store_listings"""
+
+    def test_page_urls(self):
+        """Test page 1 uses the bare city URL and later pages add ?page="""
+        ingestor = _ingestor()
+        ingestor.config.max_pages = 3
+
+        with patch.object(
+            ingestor.session, "get", side_effect=requests.ConnectionError
+        ) as get:
+            stats = ingestor.store_listings(city="new-york-city")
+
+        base_url = "https://www.listingsproject.com/real-estate/new-york-city/sublets"
+        assert [call.args[0] for call in get.call_args_list] == [
+            base_url,
+            f"{base_url}?page=2",
+            f"{base_url}?page=3",
+        ]
+        assert stats["errors"] == 3
+
+    def test_cards_found_among_page_markup(self):
+        """Test cards are still found when the rest of the page is skipped"""
+        ingestor = _ingestor()
+        page = MagicMock(
+            text=f"<html><body><nav><a href='/listings/nav'>Nav</a></nav>"
+            f"<main>{CARD_HTML}</main></body></html>"
+        )
+
+        with (
+            patch.object(ingestor.session, "get", return_value=page),
+            patch.object(
+                ingestor, "_existing_listing_ids", return_value={"sunny-room-1"}
+            ) as existing,
+        ):
+            stats = ingestor.store_listings(city="new-york-city")
+
+        existing.assert_called_once_with(["sunny-room-1"])
+        assert stats["pages_processed"] == 1
+        assert stats["duplicates_skipped"] == 1
+
+    def test_new_listing_built_from_card_and_details(self):
+        """Test a new card is merged with its detail page and stored"""
+        ingestor = _ingestor()
+        page = MagicMock(text=f"<html><body>{CARD_HTML}</body></html>")
+        listing_url = "https://www.listingsproject.com/listings/sunny-room-1"
+
+        with (
+            patch.object(ingestor.session, "get", return_value=page),
+            patch.object(ingestor, "_existing_listing_ids", return_value=set()),
+            patch.object(
+                ingestor, "_fetch_details", return_value=[{"name": "Jane Doe"}]
+            ) as fetch_details,
+            patch.object(ingestor, "_store_page_listings", return_value=1) as store,
+        ):
+            stats = ingestor.store_listings(city="new-york-city")
+
+        fetch_details.assert_called_once_with([listing_url])
+        (listing,) = store.call_args.args[0]
+        assert listing.id == "sunny-room-1"
+        assert listing.url == listing_url
+        assert listing.contact_name == "Jane Doe"
+        assert listing.source_site == "listing_project"
+        assert stats["new_listings"] == 1
+
+    def test_empty_page_stops_pagination(self):
+        """Test an empty response body is treated as a page without listings"""
+        ingestor = _ingestor()
+        ingestor.config.max_pages = 3
+
+        with patch.object(
+            ingestor.session, "get", return_value=MagicMock(text="")
+        ) as get:
+            stats = ingestor.store_listings(city="new-york-city")
+
+        get.assert_called_once()
+        assert stats["pages_processed"] == 0
+        assert stats["errors"] == 0
+
+
+class TestSync:
+    """Test syncing across the configured cities"""
+
+    def test_cities_scraped_concurrently(self):
+        """Test each city is scraped at the same time and stats are summed"""
+        ingestor = _ingestor()
+        ingestor.config.supported_cities = ["new-york-city", "boston"]
+        both_started = threading.Barrier(2, timeout=5)
+
+        def store_listings(city):
+            both_started.wait()
+            return {"total_processed": 3, "new_listings": 2, "errors": 0}
+
+        with patch.object(ingestor, "store_listings", side_effect=store_listings):
+            result = ingestor.sync()
+
+        assert result.success
+        assert result.total_processed == 6
+        assert result.new_listings == 4
+
+    def test_listing_seen_by_two_cities_stored_once(self):
+        """Test a listing both city threads find new is stored by only one"""
+        ingestor = _ingestor()
+        ingestor.config.supported_cities = ["new-york-city", "boston"]
+        page = MagicMock(text=f"<html><body>{CARD_HTML}</body></html>")
+        both_checked = threading.Barrier(2, timeout=5)
+        stored = []
+
+        def existing_listing_ids(listing_ids):
+            # Both cities query before either has stored the listing
+            both_checked.wait()
+            return set()
+
+        def store_page_listings(listings):
+            stored.extend(listing.id for listing in listings)
+            return len(listings)
+
+        with (
+            patch.object(ingestor.session, "get", return_value=page),
+            patch.object(
+                ingestor, "_existing_listing_ids", side_effect=existing_listing_ids
+            ),
+            patch.object(
+                ingestor, "_fetch_details", side_effect=lambda urls: [{}] * len(urls)
+            ),
+            patch.object(
+                ingestor, "_store_page_listings", side_effect=store_page_listings
+            ),
+        ):
+            result = ingestor.sync()
+
+        assert stored == ["sunny-room-1"]
+        assert result.success
+        assert result.new_listings == 1
+        assert result.duplicates_skipped == 1
+
+    def test_city_failure_fails_sync(self):
+        """Test an error from one city is reported as a failed sync"""
+        ingestor = _ingestor()
+
+        with patch.object(
+            ingestor, "store_listings", side_effect=RuntimeError("blocked")
+        ):
+            result = ingestor.sync()
+
+        assert not result.success
+        assert result.error_message == "blocked"
+
+
+class TestFetchDetails:
+    """Test concurrent fetching of listing detail pages"""
+
+    def test_results_keep_url_order(self):
+        """Test details come back in the order the URLs were given"""
+        ingestor = _ingestor(detail_workers=4)
+        urls = [f"https://example.com/listings/{i}" for i in range(10)]
+
+        def fetch(url):
+            # Finish out of order
+            time.sleep(0.01 * (10 - int(url.rsplit("/", 1)[-1])))
+            return {"full_description": url}
+
+        with patch.object(ingestor, "_fetch_and_extract_details", side_effect=fetch):
+            details = ingestor._fetch_details(urls)
+
+        assert [detail["full_description"] for detail in details] == urls
+
+    def test_requests_spaced_by_delay(self):
+        """Test delay_between_listings spaces out request starts across workers"""
+        ingestor = _ingestor(detail_workers=4, delay_between_listings=0.05)
+        started = []
+
+        def fetch(url):
+            started.append(time.monotonic())
+            return {}
+
+        with patch.object(ingestor, "_fetch_and_extract_details", side_effect=fetch):
+            ingestor._fetch_details(["a", "b", "c"])
+
+        started.sort()
+        gaps = [later - earlier for earlier, later in zip(started, started[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_no_urls(self):
+        """Test an empty page makes no requests"""
+        assert _ingestor()._fetch_details([]) == []
+
+
+class TestFetchAndExtractDetails:
+    """Test extraction of listing detail pages"""
+
+    def test_extracts_description_and_contact(self):
+        """Test the description, contact name and email are read"""
+        ingestor = _ingestor()
+        response = MagicMock(text=DETAIL_HTML)
+
+        with patch.object(ingestor.session, "get", return_value=response):
+            details = ingestor._fetch_and_extract_details("https://example.com/1")
+
+        assert details == {
+            "full_description": (
+                "Sunny room in a quiet apartment. Close to the L train."
+            ),
+            "detail_fetched": True,
+            "name": "Jane Doe",
+            "email": "jane@example.com",
+        }
+
+    def test_missing_fields(self):
+        """Test pages without contact details still return a description"""
+        ingestor = _ingestor()
+        response = MagicMock(text="<html><body><p>Gone</p></body></html>")
+
+        with patch.object(ingestor.session, "get", return_value=response):
+            details = ingestor._fetch_and_extract_details("https://example.com/1")
+
+        assert details == {
+            "full_description": "",
+            "detail_fetched": True,
+            "name": None,
+            "email": None,
+        }
+
+    def test_request_error(self):
+        """Test fetch failures are reported as not fetched"""
+        ingestor = _ingestor()
+
+        with patch.object(ingestor.session, "get", side_effect=OSError("timeout")):
+            details = ingestor._fetch_and_extract_details("https://example.com/1")
+
+        assert details == {"detail_fetched": False}
+
+
+class TestLogin:
+    """Test the Listings Project login flow"""
+
+    def _login(self, login_page: str):
+        ingestor = _ingestor()
+        ingestor.session.cookies.set("user_credentials", "token")
+
+        with (
+            patch.object(
+                ingestor.session, "get", return_value=MagicMock(text=login_page)
+            ),
+            patch.object(
+                ingestor.session, "post", return_value=MagicMock(status_code=302)
+            ) as post,
+        ):
+            logged_in = ingestor._login("jane@example.com", "secret")
+
+        return logged_in, post
+
+    def test_submits_authenticity_token(self):
+        """Test the CSRF token from the login form is posted back"""
+        login_page = (
+            '<form><input type="hidden" value="abc+/12&#x3D;=" '
+            'name="authenticity_token" autocomplete="off"></form>'
+        )
+
+        logged_in, post = self._login(login_page)
+
+        assert logged_in is True
+        assert post.call_args.kwargs["data"]["authenticity_token"] == "abc+/12=="
+
+    def test_missing_token(self):
+        """Test login is abandoned when the page has no token"""
+        logged_in, post = self._login("<form><input name='email'></form>")
+
+        assert logged_in is False
+        post.assert_not_called()